@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Measure how snapshot loading scales with TaskManager(load_workers=N).
+
+The one-worker row is the regular serial load and serves as the baseline.
+Workers parse the file; the parent unpickles their records and builds the
+Task objects, overlapping with the workers still decoding later chunks.
+That parent-side share is measured separately: however many cores are
+used, a parallel load cannot finish faster than it.
+
+    python benchmarks/parallel_load_benchmark.py --tasks 200000
+"""
+
+import argparse
+import gc
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from traker.storage import JsonFileStorage, MemoryStorage
+from traker.task_manager import TaskManager
+
+def write_snapshot(path, tasks):
+    manager = TaskManager(storage=MemoryStorage())
+    with manager.batch():
+        for i in range(tasks // 2):
+            task = manager.create_task(f"Task {i}", "Synthetic benchmark task")
+            manager.log_time_block(task.id, 25)
+    JsonFileStorage(path).save({record['id']: record for record in manager.iter_records()}, [])
+
+def parent_side_seconds(path):
+    """Time the work a parallel load leaves to the parent process."""
+    records = list(JsonFileStorage(path).load().values())
+    payload = pickle.dumps(records, pickle.HIGHEST_PROTOCOL)
+    # Records arrive while TaskManager.load_tasks has garbage collection paused
+    gc.disable()
+    start = time.perf_counter()
+    received = pickle.loads(payload)
+    manager = TaskManager(storage=MemoryStorage({record['id']: record for record in received}))
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    assert len(manager.tasks) == len(records)
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=200000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.json")
+        write_snapshot(path, args.tasks)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"{args.tasks} tasks, {size_mb:.1f} MB")
+        print(f"{'workers':>8} {'load s':>8} {'speedup':>8}")
+        
+        baseline = None
+        workers = 1
+        while workers <= args.max_workers:
+            start = time.perf_counter()
+            manager = TaskManager(path, load_workers=workers)
+            elapsed = time.perf_counter() - start
+            assert len(manager.tasks) == args.tasks
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>8.2f} {baseline / elapsed:>7.2f}x")
+            workers *= 2
+            
+        parent = parent_side_seconds(path)
+        print(f"parent-side share {parent:.2f} s, speedup bound {baseline / parent:.2f}x")
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
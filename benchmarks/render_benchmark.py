@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Measure MainWindow render cost and fail when it goes over budget.
+
+The window is built but never presented, so no compositor is needed, but
+GTK still requires a display. Run it under a virtual one:
+
+    xvfb-run -a python benchmarks/render_benchmark.py --sizes 100,1000
+
+or against GTK's Broadway backend with GDK_BACKEND=broadway.
+
+Budgets are opt-in: the exit status is 1 only when a budget passed on the
+command line is exceeded. This script has not been run against the current
+window layout yet, so it ships no default budgets and must not gate CI until
+a measured run has set them. Take them from such a run with headroom, for
+example 25% over the measured widgets per task and twice the measured times.
+"""
+
+import argparse
+import gc
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk, GLib, Gio
+
+from traker.storage import MemoryStorage
+from traker.task_manager import TaskManager
+from traker.ui.main_window import MainWindow
+
+def current_rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        # Peak rather than current RSS, in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def count_widgets(root):
+    count = 0
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        count += 1
+        child = widget.get_first_child()
+        while child is not None:
+            stack.append(child)
+            child = child.get_next_sibling()
+    return count
+
+def drain(window):
+    # Let the idle handler add the remaining rows
+    context = GLib.MainContext.default()
+    while window.populate_source_id is not None:
+        context.iteration(False)
+
+def timed_refresh(window, action):
+    """Return (ms until the action returns, ms until every row is built)."""
+    start = time.perf_counter()
+    action()
+    returned = time.perf_counter()
+    drain(window)
+    finished = time.perf_counter()
+    return (returned - start) * 1000, (finished - start) * 1000
+
+def make_manager(directory, tasks, subtasks):
+    manager = TaskManager(os.path.join(directory, "tasks.json"), storage=MemoryStorage())
+    with manager.batch():
+        for i in range(tasks):
+            task = manager.create_task(f"Task {i}", "Synthetic render benchmark task")
+            for j in range(subtasks):
+                manager.add_subtask(task.id, f"Subtask {j}", duration=25)
+    return manager
+
+def run(app, size, args, directory):
+    manager = make_manager(directory, size, args.subtasks)
+    window = MainWindow(app, None)
+    empty_widgets = count_widgets(window)
+    rss_before = current_rss_mb()
+
+    _, refresh_ms = timed_refresh(window, lambda: window.set_task_manager(manager))
+    widgets = count_widgets(window) - empty_widgets
+
+    # Single actions each refresh the list; the first part is what blocks input
+    action_ms = []
+    for task in manager.get_all_tasks()[:args.actions]:
+        action_ms.append(timed_refresh(window, lambda: window.on_complete_task(task))[0])
+        action_ms.append(timed_refresh(window, lambda: window.on_undo())[0])
+
+    gc.collect()
+    rss_growth = current_rss_mb() - rss_before
+    window.destroy()
+
+    result = {
+        'refresh_ms': refresh_ms,
+        'action_ms': statistics.median(action_ms) if action_ms else 0.0,
+        'widgets_per_task': widgets / max(size, 1),
+        'rss_mb': rss_growth,
+    }
+    print(f"{size:>7} {result['refresh_ms']:>11.1f} {result['action_ms']:>10.1f} "
+          f"{widgets:>8} {result['widgets_per_task']:>10.1f} {result['rss_mb']:>8.1f}")
+    return result
+
+def over_budget(size, result, args):
+    budgets = {
+        'refresh_ms': args.refresh_ms,
+        'action_ms': args.action_ms,
+        'widgets_per_task': args.widgets_per_task,
+        'rss_mb': args.rss_mb,
+    }
+    failures = []
+    for name, budget in budgets.items():
+        if budget is not None and result[name] > budget:
+            failures.append(f"{size} tasks: {name} {result[name]:.1f} exceeds budget {budget:.1f}")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000",
+                        help="comma-separated numbers of top-level tasks")
+    parser.add_argument("--subtasks", type=int, default=4)
+    parser.add_argument("--actions", type=int, default=10,
+                        help="complete/undo pairs timed per size")
+    parser.add_argument("--refresh-ms", type=float,
+                        help="budget for building every row")
+    parser.add_argument("--action-ms", type=float,
+                        help="budget for the median single action")
+    parser.add_argument("--widgets-per-task", type=float,
+                        help="budget for widgets per top-level task with its subtasks")
+    parser.add_argument("--rss-mb", type=float,
+                        help="budget for RSS growth per size")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    failures = []
+    app = Gtk.Application(application_id="com.example.traker.benchmark",
+                          flags=Gio.ApplicationFlags.NON_UNIQUE)
+
+    def on_activate(app):
+        # Keep the application alive while windows come and go
+        app.hold()
+        with tempfile.TemporaryDirectory() as directory:
+            print(f"{'tasks':>7} {'refresh ms':>11} {'action ms':>10} {'widgets':>8} "
+                  f"{'per task':>10} {'rss MB':>8}")
+            for size in sizes:
+                failures.extend(over_budget(size, run(app, size, args, directory), args))
+        app.release()
+        app.quit()
+
+    app.connect("activate", on_activate)
+    app.run([])
+
+    if all(budget is None for budget in (args.refresh_ms, args.action_ms, args.widgets_per_task, args.rss_mb)):
+        print("No budgets given; pass --refresh-ms, --action-ms, --widgets-per-task or --rss-mb to enforce them")
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Compare TaskManager storage backends on the same workload.
+
+    python benchmarks/storage_benchmark.py --tasks 2000 --mutations 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from traker.storage import JsonFileStorage, MemoryStorage
+from traker.task_manager import TaskManager
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def run(name, make_storage, tasks, mutations):
+    storage = make_storage()
+    manager = TaskManager(storage=storage)
+        
+    def populate():
+        with manager.batch():
+            for i in range(tasks):
+                task = manager.create_task(f"Task {i}", "Benchmark task")
+                manager.add_subtask(task.id, f"Subtask {i}", duration=25)
+        
+    def mutate():
+        # Each call outside a batch saves on its own
+        for task in manager.get_all_tasks()[:mutations]:
+            manager.complete_task(task.id)
+        
+    def load():
+        TaskManager(storage=storage)
+    
+    populate_time = timed(populate)
+    mutate_time = timed(mutate)
+    load_time = timed(load)
+    print(f"{name:<10} {populate_time * 1000:>12.1f} {mutate_time * 1000 / max(mutations, 1):>14.2f} "
+          f"{load_time * 1000:>10.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--mutations", type=int, default=200)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        backends = [
+            ("memory", MemoryStorage),
+            ("json", lambda: JsonFileStorage(os.path.join(directory, "tasks.json"))),
+        ]
+        print(f"{'backend':<10} {'populate ms':>12} {'ms/mutation':>14} {'load ms':>10}")
+        for name, make_storage in backends:
+            run(name, make_storage, args.tasks, args.mutations)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
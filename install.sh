@@ -8,6 +8,13 @@ APP_DIR="$HOME/.local/share/traker"
 mkdir -p "$INSTALL_DIR"
 mkdir -p "$APP_DIR"
 
+# Compile UI resources so startup can map them instead of parsing source files
+if command -v glib-compile-resources &> /dev/null; then
+    glib-compile-resources --sourcedir=src/traker/ui \
+        --target=src/traker/ui/traker.gresource \
+        src/traker/ui/traker.gresource.xml
+fi
+
 # Copy application files
 cp -r src/traker "$APP_DIR/"
 cp run.py "$APP_DIR/"
@@ -17,6 +17,9 @@ setup(
     author="User",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    package_data={
+        "traker.ui": ["style.css", "traker.gresource"],
+    },
     python_requires=">=3.7",
     install_requires=[
         "PyGObject>=3.42.0",
@@ -0,0 +1,157 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta
+from pathlib import Path
+import gzip
+import json
+import os
+import shutil
+
+class ArchivePolicy:
+    """Decides which finished task trees leave the working set."""
+        
+    def __init__(self, completed_days: int = 30):
+        self.completed_days = completed_days
+        
+    def cutoff(self, now: Optional[datetime] = None) -> datetime:
+        return (now or datetime.now()) - timedelta(days=self.completed_days)
+        
+    def should_archive(self, tree: list, cutoff: datetime) -> bool:
+        # A tree is archived only once every task in it is finished
+        for task in tree:
+            if task.completed_at is None or task.completed_at > cutoff:
+                return False
+        return True
+
+class ArchiveWriteError(Exception):
+    """Raised when only some partitions of an append were written.
+    
+    ``written`` holds the ids of the root tasks whose trees were archived.
+    """
+        
+    def __init__(self, written: List[str], cause: Exception):
+        super().__init__(f"{cause} (archived {len(written)} trees before the failure)")
+        self.written = written
+
+class TaskArchive:
+    """Archived task records, stored as gzipped JSON Lines with one file per month.
+    
+    Partitions are keyed by the root task's completion date and only opened
+    when a read asks for the months they cover.
+    """
+        
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        
+    def _partition_path(self, moment: datetime) -> Path:
+        return self.directory / f"{moment:%Y-%m}.jsonl.gz"
+        
+    def partitions(self) -> List[Tuple[datetime, Path]]:
+        if not self.directory.exists():
+            return []
+        result = []
+        for path in self.directory.glob("*.jsonl.gz"):
+            try:
+                month = datetime.strptime(path.name[:7], "%Y-%m")
+            except ValueError:
+                continue
+            result.append((month, path))
+        return sorted(result)
+        
+    def append(self, trees: Iterable[List[dict]]):
+        """Append task trees, given as lists of records with the root first.
+        
+        Every partition is staged in a temporary file and only replaces the
+        original once all of them were written, so a failed append leaves the
+        archive unchanged. Should replacing a staged partition still fail,
+        ``ArchiveWriteError`` reports which trees were archived.
+        """
+        by_partition: Dict[Path, List[List[dict]]] = {}
+        for tree in trees:
+            completed_at = datetime.fromisoformat(tree[0]['completed_at'])
+            by_partition.setdefault(self._partition_path(completed_at), []).append(tree)
+        
+        self.directory.mkdir(parents=True, exist_ok=True)
+        staged = []
+        try:
+            for path, partition_trees in by_partition.items():
+                staging = path.with_name(path.name + ".tmp")
+                staged.append((staging, path, partition_trees))
+                with open(staging, 'wb') as out:
+                    if path.exists():
+                        with open(path, 'rb') as existing:
+                            shutil.copyfileobj(existing, out)
+                    # Each append adds a new gzip member; readers see one continuous stream
+                    with gzip.open(out, 'wt', encoding='utf-8') as f:
+                        for tree in partition_trees:
+                            for record in tree:
+                                f.write(json.dumps(record, default=str))
+                                f.write("\n")
+        except BaseException:
+            self._discard(staging for staging, _, _ in staged)
+            raise
+        
+        written: List[str] = []
+        for i, (staging, path, partition_trees) in enumerate(staged):
+            try:
+                os.replace(staging, path)
+            except OSError as e:
+                self._discard(staging for staging, _, _ in staged[i:])
+                raise ArchiveWriteError(written, e) from e
+            written.extend(tree[0]['id'] for tree in partition_trees)
+            
+    def _discard(self, paths: Iterable[Path]):
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        
+    def iter_records(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> Iterator[dict]:
+        for month, path in self.partitions():
+            next_month = (month + timedelta(days=32)).replace(day=1)
+            if since and next_month <= since:
+                continue
+            if until and month > until:
+                continue
+            tree_completed_at = None
+            for record in self._read(path):
+                if since or until:
+                    # Trees are stored root first; filter on the root's completion,
+                    # the same key that picks the partition
+                    if record.get('parent_id') is None or tree_completed_at is None:
+                        tree_completed_at = datetime.fromisoformat(record['completed_at'])
+                    if (since and tree_completed_at < since) or (until and tree_completed_at > until):
+                        continue
+                yield record
+                
+    def _read(self, path: Path) -> Iterator[dict]:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        
+    def search(self, text: str, since: Optional[datetime] = None, until: Optional[datetime] = None) -> Iterator[dict]:
+        needle = text.lower()
+        for record in self.iter_records(since, until):
+            if needle in record['title'].lower() or needle in record['description'].lower():
+                yield record
+
+class MemoryArchive(TaskArchive):
+    """Keeps archived records in memory, partitioned by month; for tests and benchmarks."""
+        
+    def __init__(self):
+        self.months: Dict[datetime, List[dict]] = {}
+        
+    def partitions(self) -> List[Tuple[datetime, datetime]]:
+        return sorted((month, month) for month in self.months)
+        
+    def append(self, trees: Iterable[List[dict]]):
+        # Round-trip through JSON so reads return what the file archive would
+        trees = [json.loads(json.dumps(tree, default=str)) for tree in trees]
+        for tree in trees:
+            completed_at = datetime.fromisoformat(tree[0]['completed_at'])
+            month = completed_at.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            self.months.setdefault(month, []).extend(tree)
+            
+    def _read(self, month: datetime) -> Iterator[dict]:
+        return (dict(record) for record in self.months[month])
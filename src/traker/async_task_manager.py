@@ -0,0 +1,149 @@
+from typing import List, Optional
+import asyncio
+import functools
+
+from .task import Task
+from .storage import StorageBackend
+from .task_manager import TaskManager
+
+# Seconds to wait before each retry of a failed write
+RETRY_DELAYS = (0.1, 0.5, 2.0)
+
+class AsyncTaskManager:
+    """Asyncio facade over TaskManager.
+    
+    Mutations are applied in memory on the event loop thread and queries never
+    touch the disk. A single writer task persists snapshots in an executor,
+    coalescing any mutations made while a write is in flight.
+    """
+        
+    def __init__(self, manager: TaskManager, executor=None):
+        self.manager = manager
+        self.manager.autosave = False
+        self._executor = executor
+        self._dirty = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._writer: Optional[asyncio.Future] = None
+        self._error: Optional[Exception] = None
+        self.manager.add_change_listener(self._on_change)
+        
+    @classmethod
+    async def open(cls, data_file: Optional[str] = None, executor=None,
+                   storage: Optional[StorageBackend] = None) -> 'AsyncTaskManager':
+        loop = asyncio.get_event_loop()
+        manager = await loop.run_in_executor(
+            executor, functools.partial(TaskManager, data_file, autosave=False, storage=storage)
+        )
+        return cls(manager, executor)
+        
+    @property
+    def current_task(self) -> Optional[Task]:
+        return self.manager.current_task
+        
+    def batch(self):
+        return self.manager.batch()
+    
+    # Mutators
+        
+    async def create_task(self, title: str, description: str = "", project_id: Optional[str] = None) -> Task:
+        return self.manager.create_task(title, description, project_id)
+        
+    async def start_task(self, task_id: str) -> bool:
+        return self.manager.start_task(task_id)
+        
+    async def resume_task(self, task_id: str) -> bool:
+        return self.manager.resume_task(task_id)
+        
+    async def pause_current_task(self) -> bool:
+        return self.manager.pause_current_task()
+        
+    async def complete_task(self, task_id: str) -> bool:
+        return self.manager.complete_task(task_id)
+        
+    async def delete_task(self, task_id: str) -> bool:
+        return self.manager.delete_task(task_id)
+        
+    async def add_subtask(self, parent_id: str, title: str, description: str = "", duration: int = 50) -> Optional[Task]:
+        return self.manager.add_subtask(parent_id, title, description, duration)
+        
+    async def log_time_block(self, task_id: str, duration: int, is_break: bool = False):
+        self.manager.log_time_block(task_id, duration, is_break)
+        
+    async def undo(self) -> bool:
+        return self.manager.undo()
+        
+    async def redo(self) -> bool:
+        return self.manager.redo()
+    
+    # Queries
+        
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        return self.manager.get_task(task_id)
+        
+    async def get_all_tasks(self) -> List[Task]:
+        return self.manager.get_all_tasks()
+        
+    async def get_subtasks(self, parent_id: str) -> List[Task]:
+        return self.manager.get_subtasks(parent_id)
+        
+    async def get_tasks_needing_break(self) -> List[Task]:
+        return self.manager.get_tasks_needing_break()
+        
+    async def get_active_tasks(self) -> List[Task]:
+        return self.manager.get_active_tasks()
+        
+    async def get_completed_tasks(self) -> List[Task]:
+        return self.manager.get_completed_tasks()
+    
+    # Persistence
+        
+    def _on_change(self):
+        self._idle.clear()
+        self._dirty.set()
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.ensure_future(self._write_loop())
+        
+    async def _write_loop(self):
+        loop = asyncio.get_event_loop()
+        failures = 0
+        while self._dirty.is_set():
+            if self.manager.load_error is not None:
+                # Writing would replace the task file that failed to load
+                self._error = self.manager.load_error
+                break
+            self._dirty.clear()
+            # Convert on the loop thread so the executor never sees a half-applied mutation
+            changed, deleted = self.manager._take_delta()
+            try:
+                await loop.run_in_executor(self._executor, self.manager.storage.save, changed, deleted)
+            except Exception as e:
+                print(f"Error saving tasks: {e}")
+                self.manager._requeue_delta(changed, deleted)
+                self._error = e
+                if failures < len(RETRY_DELAYS):
+                    await asyncio.sleep(RETRY_DELAYS[failures])
+                    failures += 1
+                    self._dirty.set()
+                continue
+            failures = 0
+            if not self.manager._dirty:
+                self._error = None
+        self._idle.set()
+        
+    async def flush(self):
+        """Wait until every mutation made so far has been written.
+        
+        Raises the last save error if the writes kept failing and changes
+        are still unsaved.
+        """
+        if self._error is not None and (self._writer is None or self._writer.done()):
+            # The writer gave up after its retries; give it another round
+            self._on_change()
+        await self._idle.wait()
+        if self._error is not None and self.manager._dirty:
+            raise self._error
+        
+    async def close(self):
+        await self.flush()
+        self.manager.remove_change_listener(self._on_change)
\ No newline at end of file
@@ -0,0 +1,385 @@
+"""
+Streaming import and export of task data.
+
+Records are the plain dicts produced by ``TaskManager.iter_records`` and are
+passed around as iterators, so converting between formats only keeps one
+record in memory at a time.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime
+from pathlib import Path
+import csv
+import json
+import uuid
+
+from .snapshot import STRING_TABLE_KEY, StringTable, write_json_object
+from .workspace import Project, ProjectStatus, Workspace
+
+_CHUNK_SIZE = 64 * 1024
+
+FORMATS = ("traker", "jsonl", "csv", "electron")
+
+class _ObjectReader:
+    """Incrementally decodes the members of a top-level JSON object."""
+        
+    def __init__(self, f):
+        self.f = f
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(_CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+        
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+        
+    def take(self, expected: str):
+        char = self.peek()
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} at offset {self.pos}, found {char!r}")
+        self.pos += 1
+        
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A value ending exactly at the buffer edge may be truncated
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+        
+    def members(self) -> Iterator[Tuple[str, Any]]:
+        self.take("{")
+        if self.peek() == "}":
+            return
+        while True:
+            key = self.decode()
+            self.take(":")
+            yield key, self.decode()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.take("}")
+            return
+
+def iter_json_object(path: str) -> Iterator[Tuple[str, Any]]:
+    """Yield the ``(key, value)`` members of a JSON object file one by one."""
+    with open(path, "r", encoding="utf-8") as f:
+        yield from _ObjectReader(f).members()
+
+def _timestamp_str(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return datetime.fromisoformat(str(value)).isoformat()
+
+def _local_timestamp(value: Optional[str]) -> Optional[str]:
+    """Convert a JavaScript ISO timestamp to the naive local time Traker uses."""
+    if not value:
+        return None
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return moment.isoformat()
+
+# Traker snapshot (~/.traker_tasks.json)
+
+def iter_snapshot(path: str) -> Iterator[dict]:
+    table = StringTable()
+    for key, value in iter_json_object(path):
+        if key == STRING_TABLE_KEY:
+            table = StringTable(value)
+            continue
+        yield table.decode(value)
+
+def write_snapshot(records: Iterable[dict], path: str):
+    write_json_object(((record["id"], record) for record in records), path)
+
+# JSON Lines
+
+def iter_jsonl(path: str) -> Iterator[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+def write_jsonl(records: Iterable[dict], path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, default=str))
+            f.write("\n")
+
+# CSV of time blocks (export only: rows carry no status, hierarchy or
+# estimates, so tasks cannot be rebuilt from them)
+
+TIME_BLOCK_FIELDS = ["task_id", "title", "timestamp", "duration", "is_break"]
+
+def write_time_blocks_csv(records: Iterable[dict], path: str):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(TIME_BLOCK_FIELDS)
+        for record in records:
+            for block in record.get("time_blocks", []):
+                writer.writerow([
+                    record["id"],
+                    record["title"],
+                    _timestamp_str(block.get("timestamp")),
+                    block["duration"],
+                    block["is_break"],
+                ])
+
+# Electron tracker (electron-tracker/src/shared/Task.js)
+
+def to_electron(record: dict, workspace_id: Optional[str] = None) -> dict:
+    return {
+        "id": record["id"],
+        "title": record["title"],
+        "description": record["description"],
+        "parentId": record.get("parent_id"),
+        "workspaceId": workspace_id,
+        "projectId": record.get("project_id"),
+        "status": record["status"],
+        "taskType": record["task_type"],
+        "createdAt": _timestamp_str(record["created_at"]),
+        "startedAt": _timestamp_str(record.get("started_at")),
+        "completedAt": _timestamp_str(record.get("completed_at")),
+        "estimatedDuration": record["estimated_duration"],
+        "actualDuration": record["actual_duration"],
+        "timeBlocks": [
+            {
+                "duration": block["duration"],
+                "isBreak": block["is_break"],
+                "timestamp": _timestamp_str(block.get("timestamp")),
+            }
+            for block in record.get("time_blocks", [])
+        ],
+        # The Electron loader re-attaches children through parentId
+        "subtasks": [],
+        "isResumed": record.get("is_resumed", False),
+    }
+
+def from_electron(data: dict) -> Iterator[dict]:
+    """Yield the record for an Electron task followed by its nested subtasks."""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        yield {
+            "id": item["id"],
+            "title": item["title"],
+            "description": item.get("description", ""),
+            "parent_id": item.get("parentId"),
+            "project_id": item.get("projectId"),
+            "status": item["status"],
+            "task_type": item["taskType"],
+            "created_at": _local_timestamp(item["createdAt"]),
+            "started_at": _local_timestamp(item.get("startedAt")),
+            "completed_at": _local_timestamp(item.get("completedAt")),
+            "estimated_duration": item["estimatedDuration"],
+            "actual_duration": item.get("actualDuration", 0),
+            "time_blocks": [
+                {
+                    "duration": block["duration"],
+                    "is_break": block.get("isBreak", False),
+                    "timestamp": _local_timestamp(block.get("timestamp")),
+                }
+                for block in item.get("timeBlocks", [])
+            ],
+            "is_resumed": item.get("isResumed", False),
+        }
+        stack.extend(reversed(item.get("subtasks", [])))
+
+def iter_electron(path: str) -> Iterator[dict]:
+    # Subtasks are stored both nested in their parent and at the top level
+    seen = set()
+    for _, data in iter_json_object(path):
+        for record in from_electron(data):
+            if record["id"] not in seen:
+                seen.add(record["id"])
+                yield record
+
+def write_electron(records: Iterable[dict], path: str):
+    write_json_object(((record["id"], to_electron(record)) for record in records), path)
+
+# The Electron app keeps projects and workspaces in files named after its task file
+def _companion_path(path: str, suffix: str) -> str:
+    return str(Path(path).with_suffix('')) + suffix
+
+def workspace_to_electron(workspace: Workspace) -> dict:
+    return {
+        "id": workspace.id,
+        "name": workspace.name,
+        "color": workspace.color,
+        "createdAt": workspace.created_at.isoformat(),
+        "isDefault": workspace.is_default,
+    }
+
+def project_to_electron(project: Project, task_ids: List[str]) -> dict:
+    return {
+        "id": project.id,
+        "name": project.name,
+        "description": project.description,
+        "workspaceId": project.workspace_id,
+        "status": project.status.value,
+        "createdAt": project.created_at.isoformat(),
+        "updatedAt": project.updated_at.isoformat(),
+        "color": project.color,
+        "tasks": task_ids,
+        "priority": project.priority,
+        "deadline": project.deadline.isoformat() if project.deadline else None,
+        "progress": project.progress,
+    }
+
+def project_from_electron(data: dict, workspace_id: Optional[str]) -> Project:
+    project = Project(data["name"], data.get("description", ""), workspace_id)
+    project.id = data["id"]
+    project.status = ProjectStatus(data.get("status", "active"))
+    if data.get("createdAt"):
+        project.created_at = datetime.fromisoformat(_local_timestamp(data["createdAt"]))
+    if data.get("updatedAt"):
+        project.updated_at = datetime.fromisoformat(_local_timestamp(data["updatedAt"]))
+    project.color = data.get("color", project.color)
+    project.priority = data.get("priority", project.priority)
+    if data.get("deadline"):
+        project.deadline = datetime.fromisoformat(_local_timestamp(data["deadline"]))
+    project.progress = data.get("progress", 0)
+    return project
+
+def export_electron(manager, path: str):
+    """Write the active workspace as an Electron task file plus its projects and workspaces files.
+    
+    The Electron app only lists tasks of its current project, so tasks without
+    a project are exported into a "General Tasks" project, as the app creates
+    by default.
+    """
+    registry = manager.workspaces
+    workspace_id = registry.current_workspace_id
+    general = Project("General Tasks", "Default project for work tasks", workspace_id)
+    # Stable across exports, so re-exporting does not create another project
+    general.id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"traker:{workspace_id}:general"))
+    project_tasks: Dict[str, List[str]] = {}
+    
+    def members():
+        # Tree order, since the Electron loader attaches subtasks in file order
+        for record in manager.iter_records():
+            if record["project_id"] not in registry.projects:
+                record["project_id"] = general.id
+            if record["parent_id"] is None:
+                project_tasks.setdefault(record["project_id"], []).append(record["id"])
+            yield record["id"], to_electron(record, workspace_id)
+            
+    write_json_object(members(), path)
+    
+    projects = list(registry.projects.values())
+    if general.id in project_tasks:
+        projects.append(general)
+    current_project_id = registry.current_project_id
+    if current_project_id is None:
+        in_workspace = [project for project in projects if project.workspace_id == workspace_id]
+        current_project_id = general.id if general in projects else (in_workspace[0].id if in_workspace else None)
+    with open(_companion_path(path, "_projects.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "projects": {project.id: project_to_electron(project, project_tasks.get(project.id, []))
+                         for project in projects},
+            "currentProjectId": current_project_id,
+        }, f, indent=2)
+    with open(_companion_path(path, "_workspaces.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "workspaces": {workspace.id: workspace_to_electron(workspace)
+                           for workspace in registry.workspaces.values()},
+            "currentWorkspaceId": workspace_id,
+        }, f, indent=2)
+
+_READERS = {
+    "traker": iter_snapshot,
+    "jsonl": iter_jsonl,
+    "electron": iter_electron,
+}
+
+_WRITERS = {
+    "traker": write_snapshot,
+    "jsonl": write_jsonl,
+    "csv": write_time_blocks_csv,
+    "electron": write_electron,
+}
+
+def read_records(path: str, fmt: str = "jsonl") -> Iterator[dict]:
+    if fmt == "csv":
+        raise ValueError("Cannot import from csv: it holds time blocks, not tasks")
+    if fmt not in _READERS:
+        raise ValueError(f"Cannot import from format: {fmt}")
+    return _READERS[fmt](path)
+
+def write_records(records: Iterable[dict], path: str, fmt: str = "jsonl"):
+    if fmt not in _WRITERS:
+        raise ValueError(f"Cannot export to format: {fmt}")
+    _WRITERS[fmt](records, path)
+
+def convert(src: str, src_fmt: str, dst: str, dst_fmt: str):
+    """Stream records from one file and format to another."""
+    write_records(read_records(src, src_fmt), dst, dst_fmt)
+
+def export_tasks(manager, path: str, fmt: str = "jsonl"):
+    if fmt == "electron":
+        export_electron(manager, path)
+        return
+    write_records(manager.iter_records(), path, fmt)
+
+def import_tasks(manager, path: str, fmt: str = "jsonl") -> int:
+    """Load records into ``manager`` with a single save. Returns the count."""
+    count = manager.add_records(read_records(path, fmt))
+    if count:
+        _adopt_projects(manager, path, fmt)
+    return count
+
+def _adopt_projects(manager, path: str, fmt: str):
+    """Register projects that imported tasks refer to but the registry lacks.
+    
+    Electron exports name them in their projects file; any others get a
+    placeholder so no task is left pointing at a missing project.
+    """
+    registry = manager.workspaces
+    missing = {task.project_id for task in manager.tasks.values()
+               if task.project_id and task.project_id not in registry.projects}
+    if not missing:
+        return
+    known = {}
+    projects_file = _companion_path(path, "_projects.json")
+    if fmt == "electron" and Path(projects_file).exists():
+        with open(projects_file, "r", encoding="utf-8") as f:
+            known = json.load(f).get("projects", {})
+    # Imported tasks live in the active workspace, so their projects do too
+    for project_id in missing:
+        if project_id in known:
+            project = project_from_electron(known[project_id], registry.current_workspace_id)
+        else:
+            project = Project(f"Imported project {project_id[:8]}", "", registry.current_workspace_id)
+            project.id = project_id
+        registry.projects[project_id] = project
+    registry.save()
\ No newline at end of file
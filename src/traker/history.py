@@ -0,0 +1,43 @@
+from typing import Dict, Optional, Tuple
+from collections import deque
+
+class Operation:
+    """Task states to restore, keyed by task id.
+    
+    A state is ``(record, index)`` where ``index`` is the task's position in its
+    parent's subtasks, or None when the task should not exist.
+    """
+        
+    def __init__(self, label: str, current_id: Optional[str]):
+        self.label = label
+        self.current_id = current_id
+        self.states: Dict[str, Optional[Tuple[dict, int]]] = {}
+        
+    def extend(self, later: 'Operation'):
+        """Add the states of a later operation, keeping this one's for tasks in both."""
+        for task_id, state in later.states.items():
+            self.states.setdefault(task_id, state)
+        
+    def __repr__(self):
+        return f"Operation('{self.label}', tasks={len(self.states)})"
+
+class OperationLog:
+    """Bounded undo/redo stacks; the oldest entries are evicted first."""
+        
+    def __init__(self, capacity: int = 100):
+        self.undo_stack = deque(maxlen=capacity)
+        self.redo_stack = deque(maxlen=capacity)
+        
+    def record(self, operation: Operation):
+        self.undo_stack.append(operation)
+        self.redo_stack.clear()
+        
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+        
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+        
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
\ No newline at end of file
@@ -2,18 +2,31 @@
 
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk, GLib, Gdk
+from gi.repository import Gtk, GLib, Gdk, Gio
+import os
 import sys
+import threading
+import time
 from pathlib import Path
 
+from .archive import ArchivePolicy
 from .task import Task
 from .task_manager import TaskManager
 from .ui.main_window import MainWindow
 
+_START_TIME = time.perf_counter()
+
+RESOURCE_FILE = Path(__file__).parent / "ui" / "traker.gresource"
+RESOURCE_PREFIX = "/com/example/traker"
+
 class TrakerApp(Gtk.Application):
     def __init__(self):
         super().__init__(application_id='com.example.traker')
-        self.task_manager = TaskManager()
+        self.task_manager = None
+        self.time_to_first_frame = None
+        
+    def do_startup(self):
+        Gtk.Application.do_startup(self)
         self.load_css()
         
     def load_css(self):
@@ -22,7 +35,12 @@ class TrakerApp(Gtk.Application):
         css_file = Path(__file__).parent / "ui" / "style.css"
         
         try:
-            css_provider.load_from_path(str(css_file))
+            # Prefer the compiled resource bundle; fall back to the source file
+            if RESOURCE_FILE.exists():
+                Gio.resources_register(Gio.Resource.load(str(RESOURCE_FILE)))
+                css_provider.load_from_resource(f"{RESOURCE_PREFIX}/style.css")
+            else:
+                css_provider.load_from_path(str(css_file))
             Gtk.StyleContext.add_provider_for_display(
                 Gdk.Display.get_default(),
                 css_provider,
@@ -30,10 +48,57 @@ class TrakerApp(Gtk.Application):
             )
         except Exception as e:
             print(f"Warning: Could not load CSS file: {e}")
-        
+            
     def do_activate(self):
+        windows = self.get_windows()
+        if windows:
+            windows[0].present()
+            return
+            
+        # Show the window first; tasks are loaded off the main thread
         window = MainWindow(self, self.task_manager)
         window.present()
+        self.watch_first_frame(window)
+        
+        if self.task_manager is None:
+            thread = threading.Thread(target=self.load_tasks, args=(window,), daemon=True)
+            thread.start()
+            
+    def load_tasks(self, window):
+        try:
+            task_manager = TaskManager(archive_policy=ArchivePolicy(completed_days=30))
+        except Exception as e:
+            print(f"Error loading tasks: {e}")
+            GLib.idle_add(self.on_tasks_load_failed, window, e)
+            return
+        if task_manager.load_error is not None:
+            # The manager refuses to save, but the window should not offer it for editing
+            GLib.idle_add(self.on_tasks_load_failed, window, task_manager.load_error)
+            return
+        GLib.idle_add(self.on_tasks_loaded, window, task_manager)
+        
+    def on_tasks_loaded(self, window, task_manager):
+        self.task_manager = task_manager
+        window.set_task_manager(task_manager)
+        return False
+        
+    def on_tasks_load_failed(self, window, error):
+        # No manager here: editing an empty task list would suggest the tasks are gone
+        window.show_load_error(error)
+        return False
+        
+    def watch_first_frame(self, window):
+        frame_clock = window.get_frame_clock()
+        if frame_clock is None:
+            return
+            
+        def on_after_paint(clock):
+            clock.disconnect(handler_id)
+            self.time_to_first_frame = time.perf_counter() - _START_TIME
+            if os.environ.get("TRAKER_STARTUP_METRICS"):
+                print(f"Time to first frame: {self.time_to_first_frame * 1000:.1f} ms")
+                
+        handler_id = frame_clock.connect("after-paint", on_after_paint)
 
 def main():
     app = TrakerApp()
@@ -0,0 +1,85 @@
+"""
+Opt-in parallel loading of large task snapshots.
+
+JsonFileStorage writes one task record per line, so the file can be cut at
+line boundaries into chunks that decode independently. Each chunk is parsed
+and its string table references resolved in a worker process. Chunks are
+handed back in file order as they finish, so the caller turns one chunk into
+Task objects while the workers are still decoding the next ones.
+"""
+
+from typing import Iterator, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+import gc
+import json
+import os
+
+from .snapshot import STRING_TABLE_KEY, StringTable
+
+_worker_table = None
+
+def _init_worker(strings: Optional[List[str]]):
+    global _worker_table
+    # Workers live for one load and only build records that are sent back
+    gc.disable()
+    _worker_table = StringTable(strings)
+
+def _parse_member(line: str):
+    line = line.strip()
+    if line in ("", "{", "}", "{}"):
+        return None
+    return next(iter(json.loads("{" + line.rstrip(",") + "}").items()))
+
+def _decode_chunk(path: str, start: int, end: int) -> List[dict]:
+    records = []
+    with open(path, "rb") as f:
+        if start:
+            # Skip to the first line that starts inside this chunk
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() <= end:
+            line = f.readline()
+            if not line:
+                break
+            member = _parse_member(line.decode("utf-8"))
+            if member is None or member[0] == STRING_TABLE_KEY:
+                continue
+            records.append(_worker_table.decode(member[1]))
+    return records
+
+def _read_string_table(path: str) -> Optional[List[str]]:
+    """Return the string table, or raise ValueError if records are not one per line."""
+    with open(path, "r", encoding="utf-8") as f:
+        if f.readline().strip() != "{":
+            raise ValueError("not a line-per-record snapshot")
+        member = _parse_member(f.readline())
+    if member is None:
+        return None
+    return member[1] if member[0] == STRING_TABLE_KEY else None
+
+# Chunks per worker; smaller chunks let the caller start building tasks sooner
+CHUNKS_PER_WORKER = 4
+
+def load_tasks_parallel(path: str, workers: Optional[int] = None) -> Optional[Iterator[List[dict]]]:
+    """Decode the task records of a snapshot across ``workers`` processes.
+    
+    Returns an iterator over lists of records in file order, or None when the
+    file is missing or was not written one record per line, in which case
+    callers should fall back to a regular load.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        strings = _read_string_table(path)
+    except ValueError:
+        return None
+    
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    step = max(size // (workers * CHUNKS_PER_WORKER), 1)
+    ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+    return _decode_chunks(path, ranges, workers, strings)
+
+def _decode_chunks(path: str, ranges, workers: int, strings: Optional[List[str]]) -> Iterator[List[dict]]:
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(strings,)) as pool:
+        yield from pool.map(_decode_chunk, [path] * len(ranges), *zip(*ranges))
@@ -0,0 +1,123 @@
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+
+from .task import Task, TaskStatus
+
+WORK_BLOCK_CAP = 50  # minutes, same cap as Task.create_subtask
+BREAK_AFTER = 50  # minutes of work before Task.should_take_break
+BREAK_LENGTH = 10  # minutes
+
+class PlanBlock:
+    def __init__(self, start: datetime, minutes: int, task_id: Optional[str] = None, title: str = ""):
+        self.start = start
+        self.minutes = minutes
+        self.task_id = task_id
+        self.title = title
+        
+    @property
+    def is_break(self) -> bool:
+        return self.task_id is None
+        
+    @property
+    def end(self) -> datetime:
+        return self.start + timedelta(minutes=self.minutes)
+        
+    def __repr__(self):
+        label = "Break" if self.is_break else self.title
+        return f"PlanBlock('{label}', {self.start:%H:%M}-{self.end:%H:%M})"
+
+class _Unit:
+    """One task's remaining work and the layout state it was placed from."""
+        
+    def __init__(self, task: Task, minutes: int):
+        self.task_id = task.id
+        self.title = task.title
+        self.minutes = minutes
+        self.start = None
+        self.worked = 0
+        self.block_index = 0
+        self.unscheduled = False
+
+class DayPlanner:
+    """Lays pending work out as work and break blocks inside a time window.
+    
+    Work blocks are capped at 50 minutes and a 10 minute break follows every 50
+    minutes of work. Each unit remembers where its layout started, so when a task
+    completes or runs over only the blocks from that task onwards are recomputed.
+    """
+        
+    def __init__(self, start: datetime, end: datetime):
+        self.start = start
+        self.end = end
+        self.blocks: List[PlanBlock] = []
+        self.units: List[_Unit] = []
+        self._unit_index: Dict[str, int] = {}
+        
+    @property
+    def unscheduled(self) -> List[str]:
+        """Ids of tasks whose remaining work does not fit in the window."""
+        return [unit.task_id for unit in self.units if unit.unscheduled]
+        
+    def plan(self, tasks: List[Task]) -> List[PlanBlock]:
+        self.units = []
+        for root in tasks:
+            # Depth first, so subtasks are planned right after their parent
+            stack = [root]
+            while stack:
+                task = stack.pop()
+                if task.status != TaskStatus.COMPLETED:
+                    self.units.append(_Unit(task, self._remaining_minutes(task)))
+                stack.extend(reversed(task.subtasks))
+        self._unit_index = {unit.task_id: i for i, unit in enumerate(self.units)}
+        self._layout_from(0)
+        return self.blocks
+        
+    def complete(self, task_id: str) -> List[PlanBlock]:
+        return self.set_remaining(task_id, 0)
+        
+    def overrun(self, task_id: str, extra_minutes: int) -> List[PlanBlock]:
+        index = self._unit_index.get(task_id)
+        if index is None:
+            return self.blocks
+        return self.set_remaining(task_id, self.units[index].minutes + extra_minutes)
+        
+    def set_remaining(self, task_id: str, minutes: int) -> List[PlanBlock]:
+        index = self._unit_index.get(task_id)
+        if index is None:
+            return self.blocks
+        self.units[index].minutes = max(minutes, 0)
+        self._layout_from(index)
+        return self.blocks
+        
+    def _remaining_minutes(self, task: Task) -> int:
+        worked = sum(block['duration'] for block in task.time_blocks if not block['is_break'])
+        return max(task.estimated_duration - worked, 0)
+        
+    def _layout_from(self, index: int):
+        if index == 0:
+            now, worked = self.start, 0
+            del self.blocks[:]
+        else:
+            unit = self.units[index]
+            now, worked = unit.start, unit.worked
+            del self.blocks[unit.block_index:]
+        
+        for unit in self.units[index:]:
+            unit.start, unit.worked, unit.block_index = now, worked, len(self.blocks)
+            remaining = unit.minutes
+            while remaining > 0 and now < self.end:
+                available = int((self.end - now).total_seconds() // 60)
+                if available <= 0:
+                    break
+                if worked >= BREAK_AFTER:
+                    minutes = min(BREAK_LENGTH, available)
+                    self.blocks.append(PlanBlock(now, minutes))
+                    now += timedelta(minutes=minutes)
+                    worked = 0
+                    continue
+                minutes = min(remaining, WORK_BLOCK_CAP - worked, available)
+                self.blocks.append(PlanBlock(now, minutes, unit.task_id, unit.title))
+                now += timedelta(minutes=minutes)
+                worked += minutes
+                remaining -= minutes
+            unit.unscheduled = remaining > 0
\ No newline at end of file
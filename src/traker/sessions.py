@@ -0,0 +1,193 @@
+"""
+Timer session events and activity timeline reconstruction.
+
+The event log is JSON Lines. Each recorder run starts with a header object
+that anchors its monotonic clock to wall time, followed by compact events:
+
+    {"anchor": "2024-05-01T09:00:00.000000"}
+    ["start", "<task id>", 0, false]
+    ["pause", "<task id>", 754000, false]
+
+The third field is milliseconds since the latest header and the fourth marks
+breaks. The monotonic clock stops while the machine is suspended, so when it
+falls behind wall time the recorder writes a continuation header,
+``{"anchor": ..., "continued": true}``, that re-anchors the same run.
+
+Event times are timezone-aware UTC, so daylight saving changes do not affect
+durations; convert them with ``astimezone()`` for display.
+"""
+
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import io
+import json
+import time
+
+EVENT_KINDS = ("start", "pause", "resume", "stop", "finish")
+
+# How far wall time may run ahead of the monotonic offset before re-anchoring
+DRIFT_TOLERANCE = timedelta(seconds=2)
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+class SessionRecorder:
+    """Appends timer events to the log, opening it on the first event."""
+        
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._origin = 0.0
+        self._anchor: Optional[datetime] = None
+        
+    def record(self, kind: str, task_id: Optional[str], is_break: bool = False):
+        if kind not in EVENT_KINDS:
+            raise ValueError(f"Unknown session event: {kind}")
+        try:
+            now = time.monotonic()
+            wall = _now()
+            if self._file is None:
+                self._file = self._open()
+                self._write_anchor(now, wall, continued=False)
+            elif wall - self._anchor - timedelta(seconds=now - self._origin) > DRIFT_TOLERANCE:
+                # Typically a suspend, during which the monotonic clock did not advance.
+                # A wall clock stepped back is not followed: monotonic offsets stay correct.
+                self._write_anchor(now, wall, continued=True)
+            offset_ms = int((now - self._origin) * 1000)
+            self._file.write(json.dumps([kind, task_id, offset_ms, is_break]) + "\n")
+            self._file.flush()
+        except OSError as e:
+            print(f"Error recording session event: {e}")
+        
+    def _write_anchor(self, now: float, wall: datetime, continued: bool):
+        header = {'anchor': wall.isoformat()}
+        if continued:
+            header['continued'] = True
+        self._file.write(json.dumps(header) + "\n")
+        self._origin = now
+        self._anchor = wall
+        
+    def _open(self):
+        return open(self.path, 'a', encoding='utf-8')
+        
+    def events(self) -> Iterator['Event']:
+        """Replay every event recorded so far, including those of earlier runs."""
+        if not Path(self.path).exists():
+            return iter(())
+        return iter_events(self.path)
+        
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class MemorySessionRecorder(SessionRecorder):
+    """Keeps the event log in memory; for tests and benchmarks."""
+        
+    def __init__(self):
+        super().__init__("")
+        self.log = io.StringIO()
+        
+    def _open(self):
+        return self.log
+        
+    def events(self) -> Iterator['Event']:
+        return parse_events(self.log.getvalue().splitlines())
+        
+    def close(self):
+        # The next event starts a new run, as with a reopened file
+        self._file = None
+
+class ActivityInterval:
+    def __init__(self, task_id: Optional[str], start: datetime, end: datetime, is_break: bool, ended_by: str):
+        self.task_id = task_id
+        self.start = start
+        self.end = end
+        self.is_break = is_break
+        # "pause", "stop", "finish", or "incomplete" when the log ends mid-session
+        self.ended_by = ended_by
+        
+    @property
+    def duration(self) -> timedelta:
+        return self.end - self.start
+        
+    def __repr__(self):
+        kind = "break" if self.is_break else "work"
+        start, end = self.start.astimezone(), self.end.astimezone()
+        return f"ActivityInterval({kind}, {start:%Y-%m-%d %H:%M:%S}-{end:%H:%M:%S}, {self.ended_by})"
+
+# Events are (moment, kind, task_id, is_break); kind "session" marks a new recorder run
+Event = Tuple[datetime, str, Optional[str], bool]
+
+def iter_events(path: str) -> Iterator[Event]:
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from parse_events(f)
+
+def parse_events(lines: Iterable[str]) -> Iterator[Event]:
+    anchor = None
+    last = None
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        data = json.loads(line)
+        if isinstance(data, dict):
+            moment = datetime.fromisoformat(data['anchor'])
+            if moment.tzinfo is None:
+                # Logs written before anchors were UTC hold naive local time
+                moment = moment.astimezone(timezone.utc)
+            if data.get('continued'):
+                # A continuation only ever moves time forward
+                anchor = max(moment, last) if last is not None else moment
+            else:
+                anchor = moment
+                yield anchor, "session", None, False
+        elif anchor is not None:
+            kind, task_id, offset_ms, is_break = data
+            last = anchor + timedelta(milliseconds=offset_ms)
+            yield last, kind, task_id, bool(is_break)
+
+def reconstruct_timeline(events: Iterable[Event]) -> Iterator[ActivityInterval]:
+    """Turn events into the intervals during which each timer was actually running.
+    
+    Only running and paused timers are held in memory, so months of events
+    stream through in constant space.
+    """
+    running: Dict[Optional[str], Tuple[datetime, bool]] = {}
+    paused: Dict[Optional[str], bool] = {}
+    last_moment = None
+    
+    for moment, kind, task_id, is_break in events:
+        if kind == "session":
+            # A new run cannot close timers left open by the previous one
+            for open_id, (start, open_break) in running.items():
+                yield ActivityInterval(open_id, start, last_moment or start, open_break, "incomplete")
+            running.clear()
+            paused.clear()
+        elif kind in ("start", "resume"):
+            if task_id in running:
+                start, open_break = running.pop(task_id)
+                yield ActivityInterval(task_id, start, moment, open_break, "incomplete")
+            if kind == "resume":
+                is_break = paused.pop(task_id, is_break)
+            running[task_id] = (moment, is_break)
+        elif task_id in running:
+            start, open_break = running.pop(task_id)
+            yield ActivityInterval(task_id, start, moment, open_break, kind)
+            if kind == "pause":
+                paused[task_id] = open_break
+        elif kind != "pause":
+            paused.pop(task_id, None)
+        last_moment = moment
+    
+    for open_id, (start, open_break) in running.items():
+        yield ActivityInterval(open_id, start, last_moment or start, open_break, "incomplete")
+
+def summarize(intervals: Iterable[ActivityInterval]) -> Dict[Optional[str], Dict[str, timedelta]]:
+    """Total work and break time per task."""
+    totals: Dict[Optional[str], Dict[str, timedelta]] = {}
+    for interval in intervals:
+        entry = totals.setdefault(interval.task_id, {'work': timedelta(), 'break': timedelta()})
+        entry['break' if interval.is_break else 'work'] += interval.duration
+    return totals
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+Encoding of the task snapshot file (~/.traker_tasks.json).
+
+The snapshot is a JSON object with one task record per line, keyed by task
+id. It may start with a table of shared strings that the titles and
+descriptions of records refer to by index:
+
+    {
+    "__strings__": ["Subdivide: Report", "..."],
+    "<task id>": {"id": "<task id>", "title": 0, "description": 1, ...}
+    }
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import json
+import os
+
+STRING_TABLE_KEY = "__strings__"
+INTERNED_FIELDS = ("title", "description")
+
+class StringTable:
+    """Deduplicated strings, each stored once and referenced by position."""
+        
+    def __init__(self, strings: Optional[List[str]] = None):
+        self.strings: List[str] = list(strings or [])
+        self.index: Dict[str, int] = {value: i for i, value in enumerate(self.strings)}
+        
+    def add(self, value: str) -> int:
+        position = self.index.get(value)
+        if position is None:
+            position = self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return position
+        
+    def encode(self, record: dict) -> dict:
+        encoded = dict(record)
+        for field in INTERNED_FIELDS:
+            if isinstance(encoded.get(field), str):
+                encoded[field] = self.add(encoded[field])
+        return encoded
+        
+    def decode(self, record: dict) -> dict:
+        for field in INTERNED_FIELDS:
+            if isinstance(record.get(field), int):
+                record[field] = self.strings[record[field]]
+        return record
+
+def write_json_object(members: Iterable[Tuple[str, Any]], path: str):
+    """Write ``(key, value)`` pairs as a JSON object, one member per line.
+    
+    The object goes to a temporary file that then replaces ``path``, so a
+    crash mid-write leaves the previous file intact.
+    """
+    temp_path = path + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("{")
+            first = True
+            for key, value in members:
+                f.write("\n" if first else ",\n")
+                f.write(json.dumps(key))
+                f.write(": ")
+                f.write(json.dumps(value, default=str))
+                first = False
+            f.write("}" if first else "\n}")
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
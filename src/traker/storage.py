@@ -0,0 +1,137 @@
+from typing import Callable, Dict, Iterable, Iterator, Optional
+from itertools import chain
+from pathlib import Path
+import json
+
+from .archive import MemoryArchive, TaskArchive
+from .parallel_load import load_tasks_parallel
+from .sessions import MemorySessionRecorder, SessionRecorder
+from .snapshot import INTERNED_FIELDS, STRING_TABLE_KEY, StringTable, write_json_object
+
+class StorageBackend:
+    """Where TaskManager keeps its task records.
+    
+    Records are the dicts produced by ``TaskManager._task_to_dict``. ``save``
+    receives only the records changed since the previous save and the ids of
+    tasks that were removed.
+    """
+        
+    def load(self) -> Dict[str, dict]:
+        raise NotImplementedError
+        
+    def iter_load(self, workers: int = 0) -> Iterator[dict]:
+        """Yield the records ``load`` returns, one by one.
+        
+        Backends that can decode in parallel use up to ``workers`` processes;
+        others ignore it.
+        """
+        return iter(self.load().values())
+        
+    def save(self, changed: Dict[str, dict], deleted: Iterable[str]):
+        raise NotImplementedError
+        
+    def query(self, predicate: Callable[[dict], bool]) -> Iterator[dict]:
+        raise NotImplementedError
+        
+    def shard(self, workspace_id: str) -> 'StorageBackend':
+        """Return the backend holding the tasks of another workspace.
+        
+        Used only when TaskManager is given a backend; its workspaces then
+        exist for that session and ``MemoryStorage`` keeps their shards in memory.
+        """
+        raise NotImplementedError
+        
+    def archive(self) -> TaskArchive:
+        """Return the archive for task trees leaving this backend's working set."""
+        raise NotImplementedError
+        
+    def sessions(self) -> SessionRecorder:
+        """Return the timer session log kept alongside this backend's tasks."""
+        raise NotImplementedError
+
+class MemoryStorage(StorageBackend):
+    """Keeps records in a dict; for tests and benchmarks."""
+        
+    def __init__(self, records: Optional[Dict[str, dict]] = None):
+        self.records: Dict[str, dict] = dict(records or {})
+        self.shards: Dict[str, 'MemoryStorage'] = {}
+        self._archive: Optional[TaskArchive] = None
+        self._sessions: Optional[SessionRecorder] = None
+        
+    def load(self) -> Dict[str, dict]:
+        return dict(self.records)
+        
+    def save(self, changed: Dict[str, dict], deleted: Iterable[str]):
+        self.records.update(changed)
+        for task_id in deleted:
+            self.records.pop(task_id, None)
+        
+    def query(self, predicate: Callable[[dict], bool]) -> Iterator[dict]:
+        return (record for record in self.records.values() if predicate(record))
+        
+    def shard(self, workspace_id: str) -> 'MemoryStorage':
+        return self.shards.setdefault(workspace_id, MemoryStorage())
+        
+    def archive(self) -> TaskArchive:
+        if self._archive is None:
+            self._archive = MemoryArchive()
+        return self._archive
+        
+    def sessions(self) -> SessionRecorder:
+        if self._sessions is None:
+            self._sessions = MemorySessionRecorder()
+        return self._sessions
+
+class JsonFileStorage(MemoryStorage):
+    """The ``~/.traker_tasks.json`` snapshot.
+    
+    Unchanged records are kept from the last load or save, so a save only
+    converts the changed tasks before the file is rewritten. Titles and
+    descriptions are written once to a shared string table, so repeated
+    boilerplate such as subdivision and context recovery text is stored once.
+    """
+        
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        
+    def load(self) -> Dict[str, dict]:
+        if Path(self.path).exists():
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            # Files written before the string table have only task records
+            table = StringTable(data.pop(STRING_TABLE_KEY, None))
+            self.records = {task_id: table.decode(record) for task_id, record in data.items()}
+        return dict(self.records)
+        
+    def iter_load(self, workers: int = 0) -> Iterator[dict]:
+        chunks = load_tasks_parallel(self.path, workers) if workers > 1 else None
+        if chunks is None:
+            yield from self.load().values()
+            return
+        self.records = {}
+        for chunk in chunks:
+            for record in chunk:
+                self.records[record['id']] = record
+                yield record
+        
+    def archive(self) -> TaskArchive:
+        if self._archive is None:
+            self._archive = TaskArchive(str(Path(self.path).with_suffix('')) + "_archive")
+        return self._archive
+        
+    def sessions(self) -> SessionRecorder:
+        if self._sessions is None:
+            self._sessions = SessionRecorder(str(Path(self.path).with_suffix('')) + "_sessions.jsonl")
+        return self._sessions
+        
+    def save(self, changed: Dict[str, dict], deleted: Iterable[str]):
+        super().save(changed, deleted)
+        table = StringTable()
+        for record in self.records.values():
+            for field in INTERNED_FIELDS:
+                table.add(record[field])
+        members = ((task_id, table.encode(record)) for task_id, record in self.records.items())
+        # Workspace shards live in a directory that may not exist yet
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        write_json_object(chain([(STRING_TABLE_KEY, table.strings)], members), self.path)
\ No newline at end of file
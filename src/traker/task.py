@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from enum import Enum
 import uuid
 
@@ -15,11 +15,13 @@ class TaskType(Enum):
     CONTEXT = "context"
 
 class Task:
-    def __init__(self, title: str, description: str = "", parent_id: Optional[str] = None):
+    def __init__(self, title: str, description: str = "", parent_id: Optional[str] = None,
+                 project_id: Optional[str] = None):
         self.id = str(uuid.uuid4())
         self.title = title
         self.description = description
         self.parent_id = parent_id
+        self.project_id = project_id
         self.status = TaskStatus.PENDING
         self.task_type = TaskType.MAIN if parent_id is None else TaskType.SUBTASK
         self.created_at = datetime.now()
@@ -64,7 +66,8 @@ class Task:
             subdivision_task = Task(
                 title=f"Subdivide: {self.title}",
                 description="Break down this task into smaller subtasks",
-                parent_id=self.id
+                parent_id=self.id,
+                project_id=self.project_id
             )
             subdivision_task.task_type = TaskType.SUBTASK
             subdivision_task.estimated_duration = 25
@@ -77,24 +80,37 @@ class Task:
             context_task = Task(
                 title="Context Recovery",
                 description="Get back into context of what was being done",
-                parent_id=self.id
+                parent_id=self.id,
+                project_id=self.project_id
             )
             context_task.task_type = TaskType.CONTEXT
             context_task.estimated_duration = 25
             self.subtasks.insert(0, context_task)
             
     def create_subtask(self, title: str, description: str = "", duration: int = 50):
-        subtask = Task(title=title, description=description, parent_id=self.id)
+        subtask = Task(title=title, description=description, parent_id=self.id, project_id=self.project_id)
         subtask.task_type = TaskType.SUBTASK
         subtask.estimated_duration = min(duration, 50)  # Max 50 minutes
         self.subtasks.append(subtask)
         return subtask
         
+    def walk(self) -> Iterator[Tuple['Task', int]]:
+        """Yield ``(task, depth)`` for this task and its descendants, depth first.
+        
+        Uses an explicit stack, so arbitrarily deep hierarchies are safe.
+        """
+        stack = [(self, 0)]
+        while stack:
+            task, depth = stack.pop()
+            yield task, depth
+            stack.extend((subtask, depth + 1) for subtask in reversed(task.subtasks))
+            
+    def iter_subtree(self) -> Iterator['Task']:
+        for task, _ in self.walk():
+            yield task
+            
     def get_total_estimated_time(self) -> int:
-        total = self.estimated_duration
-        for subtask in self.subtasks:
-            total += subtask.get_total_estimated_time()
-        return total
+        return sum(task.estimated_duration for task in self.iter_subtree())
         
     def get_progress_percentage(self) -> float:
         if not self.subtasks:
@@ -1,22 +1,65 @@
-from typing import List, Optional, Dict
+from typing import Callable, Iterable, Iterator, List, Optional, Dict, Tuple
+from contextlib import contextmanager
 from datetime import datetime
-import json
 from pathlib import Path
+import gc
+import shutil
 
-from .task import Task, TaskStatus
+from .archive import ArchivePolicy, ArchiveWriteError
+from .history import Operation, OperationLog
+from .scheduler import DayPlanner
+from .sessions import ActivityInterval, reconstruct_timeline
+from .storage import JsonFileStorage, StorageBackend
+from .workspace import Project, Workspace, WorkspaceRegistry
+from .task import Task, TaskStatus, TaskType
+
+# Enum lookups by value; calling the Enum class is several times slower on large loads
+_STATUSES = {status.value: status for status in TaskStatus}
+_TASK_TYPES = {task_type.value: task_type for task_type in TaskType}
+
+# Shared strings allowed beyond two per task before the unused ones are dropped
+STRING_PRUNE_SLACK = 256
 
 class TaskManager:
-    def __init__(self, data_file: Optional[str] = None):
+    def __init__(self, data_file: Optional[str] = None, autosave: bool = True,
+                 archive_policy: Optional[ArchivePolicy] = None,
+                 storage: Optional[StorageBackend] = None, load_workers: int = 0):
         self.tasks: Dict[str, Task] = {}
         self.data_file = data_file or str(Path.home() / ".traker_tasks.json")
+        # With an injected backend, workspaces live in memory and shards come from the backend
+        self._injected_storage = storage
+        self.workspaces = WorkspaceRegistry(self.data_file, persistent=storage is None)
+        self.storage = self._workspace_storage(self.workspaces.current_workspace_id)
+        self.load_workers = load_workers
+        self.autosave = autosave
         self.current_task: Optional[Task] = None
+        self.archive = self.storage.archive()
+        self.archive_policy = archive_policy
+        # One session log for all workspaces, kept by the default workspace's backend
+        self.sessions = (storage or JsonFileStorage(self.data_file)).sessions()
+        self.history = OperationLog()
+        self._pending: Optional[Operation] = None
+        # Changed task ids in the order they changed, so new records are saved in creation order
+        self._dirty: Dict[str, None] = {}
+        self._root_index: Dict[str, str] = {}
+        self._strings: Dict[str, str] = {}
+        self._listeners: List[Callable[[], None]] = []
+        self._batch_depth = 0
+        self._batch_dirty = False
+        # Set when the task file could not be read; saving would overwrite it
+        self.load_error: Optional[Exception] = None
         self.load_tasks()
+        if self.archive_policy:
+            self.archive_completed(self.archive_policy)
         
-    def create_task(self, title: str, description: str = "") -> Task:
-        task = Task(title, description)
+    def create_task(self, title: str, description: str = "", project_id: Optional[str] = None) -> Task:
+        task = Task(title, description, project_id=project_id or self.workspaces.current_project_id)
+        self._touch("Create task", task.id)
         self.tasks[task.id] = task
-        task.subdivide()
-        self.save_tasks()
+        for subtask in task.subdivide():
+            self._touch("Create task", subtask.id)
+            self.tasks[subtask.id] = subtask
+        self._changed()
         return task
         
     def get_task(self, task_id: str) -> Optional[Task]:
@@ -25,61 +68,169 @@ class TaskManager:
     def get_all_tasks(self) -> List[Task]:
         return [task for task in self.tasks.values() if task.parent_id is None]
         
+    def get_tasks_by_project(self, project_id: str) -> List[Task]:
+        return [task for task in self.tasks.values() if task.project_id == project_id]
+        
     def get_subtasks(self, parent_id: str) -> List[Task]:
         parent = self.get_task(parent_id)
         return parent.subtasks if parent else []
         
+    def get_ancestors(self, task_id: str) -> List[Task]:
+        """Return the parents of a task, nearest first."""
+        ancestors = []
+        task = self.get_task(task_id)
+        while task and task.parent_id:
+            task = self.tasks.get(task.parent_id)
+            if task:
+                ancestors.append(task)
+        return ancestors
+        
+    def get_depth(self, task_id: str) -> int:
+        return len(self.get_ancestors(task_id))
+        
+    def get_root(self, task_id: str) -> Optional[Task]:
+        """Return the top-level task a task belongs to.
+        
+        Roots are cached per task, so repeated lookups are O(1); the first lookup
+        walks up the parent chain.
+        """
+        root_id = self._root_index.get(task_id)
+        if root_id is not None and root_id in self.tasks:
+            return self.tasks[root_id]
+        task = self.get_task(task_id)
+        if task is None:
+            return None
+        path = [task_id]
+        while task.parent_id and task.parent_id in self.tasks:
+            cached = self._root_index.get(task.parent_id)
+            if cached is not None and cached in self.tasks:
+                task = self.tasks[cached]
+                break
+            task = self.tasks[task.parent_id]
+            path.append(task.id)
+        for path_id in path:
+            self._root_index[path_id] = task.id
+        return task
+        
+    def iter_tree(self) -> Iterator[Tuple[Task, int]]:
+        """Yield ``(task, depth)`` for every task, each root followed by its subtree."""
+        for root in self.get_all_tasks():
+            yield from root.walk()
+        
+    def iter_records(self) -> Iterator[dict]:
+        """Yield the saved record of every task, each root followed by its subtree."""
+        positions: Dict[str, int] = {}
+        for task in list(self.tasks.values()):
+            # Tasks whose parent is missing are exported as roots rather than dropped
+            if task.parent_id is None or task.parent_id not in self.tasks:
+                for subtask, _ in task.walk():
+                    yield self._task_to_dict(subtask, positions)
+        
+    def add_records(self, records: Iterable[dict], label: str = "Import tasks") -> int:
+        """Add tasks from saved records with one save and one undo step.
+        
+        Subtasks are attached to their parents in the order of their saved
+        positions. Returns the number of records added.
+        """
+        count = 0
+        positions = {}
+        with self.batch():
+            for record in records:
+                task = self._dict_to_task(record)
+                self._touch(label, task.id)
+                self.tasks[task.id] = task
+                positions[task.id] = record.get('position')
+                count += 1
+            if count:
+                self._rebuild_task_relationships(positions)
+                self._changed()
+        return count
+        
+    def move_task(self, task_id: str, new_parent_id: Optional[str], index: Optional[int] = None) -> bool:
+        """Reparent a task and its subtree, or make it a root when ``new_parent_id`` is None."""
+        task = self.get_task(task_id)
+        if task is None:
+            return False
+        new_parent = None
+        if new_parent_id is not None:
+            new_parent = self.get_task(new_parent_id)
+            # Refuse to move a task under itself or one of its descendants
+            if new_parent is None or new_parent is task or task in self.get_ancestors(new_parent_id):
+                return False
+                
+        self._touch("Move task", task.id)
+        self._detach(task)
+        task.parent_id = new_parent_id
+        if task.task_type != TaskType.CONTEXT:
+            task.task_type = TaskType.MAIN if new_parent is None else TaskType.SUBTASK
+        if new_parent is not None:
+            self._insert_subtask(new_parent, task, index)
+        self._forget_roots(task)
+        self._changed()
+        return True
+        
     def start_task(self, task_id: str) -> bool:
         task = self.get_task(task_id)
         if task and task.status == TaskStatus.PENDING:
+            self._touch("Start task", task.id, *self._current_ids())
             if self.current_task:
                 self.current_task.pause()
             task.start()
             self.current_task = task
-            self.save_tasks()
+            self._changed()
             return True
         return False
         
     def resume_task(self, task_id: str) -> bool:
         task = self.get_task(task_id)
         if task and task.status == TaskStatus.PAUSED:
+            self._touch("Resume task", task.id, *self._current_ids())
             if self.current_task and self.current_task != task:
                 self.current_task.pause()
             task.resume()
             task.add_context_task()
+            added = [subtask for subtask in task.subtasks if subtask.id not in self.tasks]
+            for subtask in added:
+                self._touch("Resume task", subtask.id)
+                self.tasks[subtask.id] = subtask
+            if added:
+                # The context task goes first, so every sibling moves down
+                self._dirty.update(dict.fromkeys(subtask.id for subtask in task.subtasks))
             self.current_task = task
-            self.save_tasks()
+            self._changed()
             return True
         return False
         
     def pause_current_task(self) -> bool:
         if self.current_task:
+            self._touch("Pause task", self.current_task.id)
             self.current_task.pause()
             self.current_task = None
-            self.save_tasks()
+            self._changed()
             return True
         return False
         
     def complete_task(self, task_id: str) -> bool:
         task = self.get_task(task_id)
         if task:
+            self._touch("Complete task", task.id)
             task.complete()
             if self.current_task == task:
                 self.current_task = None
-            self.save_tasks()
+            self._changed()
             return True
         return False
         
     def delete_task(self, task_id: str) -> bool:
         if task_id in self.tasks:
-            task = self.tasks[task_id]
-            for subtask in task.subtasks:
-                if subtask.id in self.tasks:
-                    del self.tasks[subtask.id]
-            del self.tasks[task_id]
-            if self.current_task and self.current_task.id == task_id:
-                self.current_task = None
-            self.save_tasks()
+            tree = list(self.tasks[task_id].iter_subtree())
+            self._touch("Delete task", *[task.id for task in tree])
+            self._detach(tree[0])
+            for task in tree:
+                self.tasks.pop(task.id, None)
+                if self.current_task is task:
+                    self.current_task = None
+            self._changed()
             return True
         return False
         
@@ -87,16 +238,18 @@ class TaskManager:
         parent = self.get_task(parent_id)
         if parent:
             subtask = parent.create_subtask(title, description, duration)
+            self._touch("Add subtask", subtask.id)
             self.tasks[subtask.id] = subtask
-            self.save_tasks()
+            self._changed()
             return subtask
         return None
         
     def log_time_block(self, task_id: str, duration: int, is_break: bool = False):
         task = self.get_task(task_id)
         if task:
+            self._touch("Log time", task.id)
             task.add_time_block(duration, is_break)
-            self.save_tasks()
+            self._changed()
             
     def get_tasks_needing_break(self) -> List[Task]:
         return [task for task in self.tasks.values() if task.should_take_break()]
@@ -108,37 +261,428 @@ class TaskManager:
     def get_completed_tasks(self) -> List[Task]:
         return [task for task in self.tasks.values() if task.status == TaskStatus.COMPLETED]
         
-    def save_tasks(self):
+    def plan_day(self, start: datetime, end: datetime) -> DayPlanner:
+        """Plan pending tasks into work and break blocks between ``start`` and ``end``."""
+        planner = DayPlanner(start, end)
+        planner.plan([task for task in self.get_all_tasks() if task.status != TaskStatus.COMPLETED])
+        return planner
+        
+    def get_activity_timeline(self, task_id: Optional[str] = None) -> Iterator[ActivityInterval]:
+        """Stream the reconstructed timer intervals, optionally for one task."""
+        for interval in reconstruct_timeline(self.sessions.events()):
+            if task_id is None or interval.task_id == task_id:
+                yield interval
+                
+    def archive_completed(self, policy: ArchivePolicy, now: Optional[datetime] = None) -> int:
+        """Move finished task trees matching ``policy`` into the archive.
+        
+        Returns the number of root tasks archived.
+        """
+        cutoff = policy.cutoff(now)
+        trees = []
+        for root in self.get_all_tasks():
+            tree = list(root.iter_subtree())
+            if policy.should_archive(tree, cutoff):
+                trees.append(tree)
+        if not trees:
+            return 0
+            
+        # Write the archive before dropping anything from the working set
+        positions: Dict[str, int] = {}
         try:
-            data = {}
-            for task_id, task in self.tasks.items():
-                data[task_id] = self._task_to_dict(task)
+            self.archive.append([self._task_to_dict(task, positions) for task in tree] for tree in trees)
+        except ArchiveWriteError as e:
+            # Drop only what reached the archive, so a later run does not archive it twice
+            print(f"Error archiving tasks: {e}")
+            trees = [tree for tree in trees if tree[0].id in e.written]
+        except Exception as e:
+            # Leave the tasks in the working set; a later run will try again
+            print(f"Error archiving tasks: {e}")
+            return 0
+        if not trees:
+            return 0
+        for tree in trees:
+            for task in tree:
+                self.tasks.pop(task.id, None)
+                self._dirty[task.id] = None
+                if self.current_task is task:
+                    self.current_task = None
+        # Undoing past this point would resurrect tasks that now live in the archive
+        self.history.clear()
+        self._changed()
+        return len(trees)
+        
+    def iter_archived_tasks(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> Iterator[Task]:
+        for record in self.archive.iter_records(since, until):
+            yield self._dict_to_task(record)
+            
+    def search_archive(self, text: str) -> Iterator[Task]:
+        for record in self.archive.search(text):
+            yield self._dict_to_task(record)
+            
+    def create_project(self, name: str, description: str = "", priority: str = "medium",
+                       color: str = "#81a1c1", workspace_id: Optional[str] = None) -> Project:
+        project = Project(name, description, workspace_id or self.workspaces.current_workspace_id)
+        project.priority = priority
+        project.color = color
+        self.workspaces.projects[project.id] = project
+        self.workspaces.save()
+        return project
+        
+    def get_project(self, project_id: str) -> Optional[Project]:
+        return self.workspaces.projects.get(project_id)
+        
+    def get_all_projects(self, workspace_id: Optional[str] = None) -> List[Project]:
+        return self.workspaces.get_projects(workspace_id or self.workspaces.current_workspace_id)
+        
+    def get_current_project(self) -> Optional[Project]:
+        return self.get_project(self.workspaces.current_project_id)
+        
+    def switch_project(self, project_id: str) -> bool:
+        project = self.get_project(project_id)
+        if project is None or project.workspace_id != self.workspaces.current_workspace_id:
+            return False
+        self.workspaces.current_project_id = project_id
+        self.workspaces.save()
+        self.pause_current_task()
+        return True
+        
+    def update_project_progress(self, project_id: str):
+        project = self.get_project(project_id)
+        if project is None or project.workspace_id != self.workspaces.current_workspace_id:
+            return
+        project_tasks = self.get_tasks_by_project(project_id)
+        completed = sum(1 for task in project_tasks if task.status == TaskStatus.COMPLETED)
+        project.update_progress(completed, len(project_tasks))
+        self.workspaces.save()
+        
+    def delete_project(self, project_id: str) -> bool:
+        """Delete a project and its tasks, including in workspaces that are not loaded."""
+        project = self.get_project(project_id)
+        if project is None:
+            return False
+        if project.workspace_id == self.workspaces.current_workspace_id:
+            with self.batch():
+                for task in self.get_tasks_by_project(project_id):
+                    if task.id in self.tasks:
+                        self.delete_task(task.id)
+        elif project.workspace_id in self.workspaces.workspaces:
+            storage = self._workspace_storage(project.workspace_id)
+            deleted = [task_id for task_id, record in storage.load().items()
+                       if record.get('project_id') == project_id]
+            if deleted:
+                storage.save({}, deleted)
+        del self.workspaces.projects[project_id]
+        if self.workspaces.current_project_id == project_id:
+            remaining = self.get_all_projects()
+            self.workspaces.current_project_id = remaining[0].id if remaining else None
+        self.workspaces.save()
+        return True
+        
+    def create_workspace(self, name: str, color: str = "#81a1c1") -> Workspace:
+        workspace = Workspace(name, color)
+        self.workspaces.workspaces[workspace.id] = workspace
+        self.workspaces.save()
+        return workspace
+        
+    def get_all_workspaces(self) -> List[Workspace]:
+        return list(self.workspaces.workspaces.values())
+        
+    def get_current_workspace(self) -> Workspace:
+        return self.workspaces.workspaces[self.workspaces.current_workspace_id]
+        
+    def switch_workspace(self, workspace_id: str) -> bool:
+        """Save the active workspace and load the shard of ``workspace_id`` in its place.
+        
+        Other workspaces are never held in memory, so switching costs one save
+        and one load of the shards involved.
+        """
+        if workspace_id not in self.workspaces.workspaces or self._batch_depth:
+            return False
+        if workspace_id == self.workspaces.current_workspace_id:
+            return True
+        self.pause_current_task()
+        self.save_tasks()
+        if self._dirty:
+            # Keep the unsaved workspace loaded rather than lose its changes
+            return False
+            
+        projects = self.workspaces.get_projects(workspace_id)
+        self.workspaces.current_workspace_id = workspace_id
+        self.workspaces.current_project_id = projects[0].id if projects else None
+        self.workspaces.save()
+        self._open_workspace_shard()
+        return True
+        
+    def delete_workspace(self, workspace_id: str) -> bool:
+        """Delete a workspace with its projects, tasks and archive; the last one cannot be deleted."""
+        if workspace_id not in self.workspaces.workspaces or len(self.workspaces.workspaces) <= 1:
+            return False
+        if workspace_id == self.workspaces.current_workspace_id:
+            other = next(other_id for other_id in self.workspaces.workspaces if other_id != workspace_id)
+            if not self.switch_workspace(other):
+                return False
                 
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+        if self._injected_storage is None:
+            shard = Path(self.workspaces.shard_path(workspace_id))
+            try:
+                shard.unlink()
+            except FileNotFoundError:
+                pass
+            shutil.rmtree(shard.with_name(shard.stem + "_archive"), ignore_errors=True)
+        else:
+            storage = self._workspace_storage(workspace_id)
+            storage.save({}, list(storage.load()))
+        del self.workspaces.workspaces[workspace_id]
+        for project in self.workspaces.get_projects(workspace_id):
+            del self.workspaces.projects[project.id]
+        self.workspaces.save()
+        return True
+        
+    def _workspace_storage(self, workspace_id: str) -> StorageBackend:
+        if self._injected_storage is None:
+            return JsonFileStorage(self.workspaces.shard_path(workspace_id))
+        if self.workspaces.workspaces[workspace_id].is_default:
+            return self._injected_storage
+        return self._injected_storage.shard(workspace_id)
+        
+    def _open_workspace_shard(self):
+        self.storage = self._workspace_storage(self.workspaces.current_workspace_id)
+        self.archive = self.storage.archive()
+        self.tasks = {}
+        self.current_task = None
+        self._dirty = {}
+        self._root_index = {}
+        self._strings = {}
+        # Operations refer to tasks of the workspace being closed
+        self.history.clear()
+        self._pending = None
+        self.load_tasks()
+        if self.archive_policy:
+            self.archive_completed(self.archive_policy)
+        for callback in list(self._listeners):
+            callback()
+            
+    def _forget_roots(self, task: Task):
+        for subtask in task.iter_subtree():
+            self._root_index.pop(subtask.id, None)
+        
+    def undo(self) -> bool:
+        if self._batch_depth or not self.history.can_undo():
+            return False
+        operation = self.history.undo_stack.pop()
+        self.history.redo_stack.append(self._replay(operation))
+        self._changed()
+        return True
+        
+    def redo(self) -> bool:
+        if self._batch_depth or not self.history.can_redo():
+            return False
+        operation = self.history.redo_stack.pop()
+        self.history.undo_stack.append(self._replay(operation))
+        self._changed()
+        return True
+        
+    def _current_ids(self) -> List[str]:
+        return [self.current_task.id] if self.current_task else []
+        
+    def _touch(self, label: str, *task_ids: str):
+        """Remember the state of tasks about to change so it can be restored."""
+        self._dirty.update(dict.fromkeys(task_ids))
+        if self._pending is None:
+            current_id = self.current_task.id if self.current_task else None
+            self._pending = Operation(label, current_id)
+        for task_id in task_ids:
+            if task_id not in self._pending.states:
+                self._pending.states[task_id] = self._capture(task_id)
+                
+    def _capture(self, task_id: str):
+        task = self.tasks.get(task_id)
+        if task is None:
+            return None
+        record = self._task_to_dict(task)
+        return (record, -1 if record['position'] is None else record['position'])
+        
+    def _replay(self, operation: Operation) -> Operation:
+        """Restore ``operation`` and return the operation that reverses it."""
+        inverse = Operation(operation.label, self.current_task.id if self.current_task else None)
+        for task_id in operation.states:
+            inverse.states[task_id] = self._capture(task_id)
+        self._restore(operation)
+        return inverse
+        
+    def _restore(self, operation: Operation):
+        self._dirty.update(dict.fromkeys(operation.states))
+        # Remove children before parents, then re-add parents before children
+        for task_id, state in reversed(list(operation.states.items())):
+            if state is None and task_id in self.tasks:
+                self._detach(self.tasks.pop(task_id))
+                
+        for task_id, state in operation.states.items():
+            if state is None:
+                continue
+            record, index = state
+            task = self.tasks.get(task_id)
+            if task is None:
+                task = self._dict_to_task(record)
+                self.tasks[task_id] = task
+            else:
+                self._detach(task)
+                if task.parent_id != record.get('parent_id'):
+                    self._forget_roots(task)
+                self._apply_dict(task, record)
+            parent = self.tasks.get(task.parent_id) if task.parent_id else None
+            if parent is not None:
+                self._insert_subtask(parent, task, index)
+                    
+        self.current_task = self.tasks.get(operation.current_id) if operation.current_id else None
+        
+    def _detach(self, task: Task):
+        parent = self.tasks.get(task.parent_id) if task.parent_id else None
+        if parent and task in parent.subtasks:
+            index = parent.subtasks.index(task)
+            del parent.subtasks[index]
+            # Later siblings move up one place, so their saved positions change
+            self._dirty.update(dict.fromkeys(subtask.id for subtask in parent.subtasks[index:]))
+            
+    def _insert_subtask(self, parent: Task, task: Task, index: Optional[int]):
+        if index is None or not 0 <= index <= len(parent.subtasks):
+            index = len(parent.subtasks)
+        parent.subtasks.insert(index, task)
+        self._dirty.update(dict.fromkeys(subtask.id for subtask in parent.subtasks[index:]))
+            
+    def add_change_listener(self, callback: Callable[[], None]):
+        self._listeners.append(callback)
+        
+    def remove_change_listener(self, callback: Callable[[], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+        
+    @contextmanager
+    def batch(self):
+        """Apply several mutations with a single save and change notification.
+        
+        Nested batches join the outermost one, but each is its own savepoint:
+        if a block raises, the tasks and the current task are restored to their
+        state when that block began, even if an enclosing batch catches the error.
+        """
+        # Collect this block's changes apart from the enclosing block's
+        outer, self._pending = self._pending, None
+        outer_dirty = self._batch_dirty
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._pending is not None:
+                self._restore(self._pending)
+            self._pending = outer
+            self._batch_dirty = outer_dirty
+            raise
+        self._batch_depth -= 1
+        if outer is not None and self._pending is not None:
+            outer.extend(self._pending)
+        if outer is not None:
+            self._pending = outer
+        if self._batch_depth == 0 and self._batch_dirty:
+            self._batch_dirty = False
+            self._changed()
+        
+    def _changed(self):
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        if self._pending is not None:
+            self.history.record(self._pending)
+            self._pending = None
+        if self.autosave:
+            self.save_tasks()
+        for callback in list(self._listeners):
+            callback()
+        
+    def save_tasks(self):
+        if self.load_error is not None:
+            print(f"Not saving tasks: the task file could not be loaded ({self.load_error})")
+            return
+        changed, deleted = self._take_delta()
+        try:
+            self.storage.save(changed, deleted)
         except Exception as e:
             print(f"Error saving tasks: {e}")
+            self._requeue_delta(changed, deleted)
             
+    def _take_delta(self) -> Tuple[Dict[str, dict], List[str]]:
+        """Convert the tasks changed since the last save and reset the change set."""
+        changed = {}
+        deleted = []
+        positions: Dict[str, int] = {}
+        for task_id in self._dirty:
+            task = self.tasks.get(task_id)
+            if task is None:
+                deleted.append(task_id)
+            else:
+                changed[task_id] = self._task_to_dict(task, positions)
+        self._dirty = {}
+        self._prune_strings()
+        return changed, deleted
+        
+    def _prune_strings(self):
+        """Forget shared strings of deleted or edited tasks once they could outnumber the live ones."""
+        # Every task refers to at most two shared strings
+        if len(self._strings) > 2 * len(self.tasks) + STRING_PRUNE_SLACK:
+            self._strings = {value: value for task in self.tasks.values()
+                             for value in (task.title, task.description)}
+        
+    def _requeue_delta(self, changed: Dict[str, dict], deleted: List[str]):
+        self._dirty.update(dict.fromkeys(changed))
+        self._dirty.update(dict.fromkeys(deleted))
+        
     def load_tasks(self):
+        # A load only allocates objects that stay alive, so collections during it are wasted work
+        gc_enabled = gc.isenabled()
+        gc.disable()
         try:
-            if Path(self.data_file).exists():
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    
-                for task_id, task_data in data.items():
-                    task = self._dict_to_task(task_data)
-                    self.tasks[task_id] = task
-                    
-                self._rebuild_task_relationships()
+            self._load_tasks()
+        finally:
+            if gc_enabled:
+                gc.enable()
+                
+    def _load_tasks(self):
+        self.load_error = None
+        try:
+            positions = {}
+            for record in self.storage.iter_load(self.load_workers):
+                task = self._dict_to_task(record)
+                self.tasks[task.id] = task
+                positions[task.id] = record.get('position')
+            self._rebuild_task_relationships(positions)
         except Exception as e:
             print(f"Error loading tasks: {e}")
+            self.load_error = e
+            self.tasks = {}
             
-    def _task_to_dict(self, task: Task) -> dict:
+    def _position(self, task: Task, positions: Optional[Dict[str, int]] = None) -> Optional[int]:
+        """Return the index of a subtask among its siblings, or None for a root.
+        
+        ``positions`` caches whole sibling lists for callers converting many tasks.
+        """
+        parent = self.tasks.get(task.parent_id) if task.parent_id else None
+        if parent is None:
+            return None
+        if positions is None:
+            return parent.subtasks.index(task) if task in parent.subtasks else None
+        if task.id not in positions:
+            positions.update((subtask.id, index) for index, subtask in enumerate(parent.subtasks))
+        return positions.get(task.id)
+        
+    def _task_to_dict(self, task: Task, positions: Optional[Dict[str, int]] = None) -> dict:
         return {
             'id': task.id,
             'title': task.title,
             'description': task.description,
             'parent_id': task.parent_id,
+            'position': self._position(task, positions),
+            'project_id': task.project_id,
             'status': task.status.value,
             'task_type': task.task_type.value,
             'created_at': task.created_at.isoformat(),
@@ -146,26 +690,58 @@ class TaskManager:
             'completed_at': task.completed_at.isoformat() if task.completed_at else None,
             'estimated_duration': task.estimated_duration,
             'actual_duration': task.actual_duration,
-            'time_blocks': task.time_blocks,
+            'time_blocks': list(task.time_blocks),
             'is_resumed': task.is_resumed
         }
         
     def _dict_to_task(self, data: dict) -> Task:
-        task = Task(data['title'], data['description'], data.get('parent_id'))
+        # Bypass Task.__init__: its new id and timestamps would be overwritten, and
+        # generating them dominated load time. _apply_dict sets every other attribute.
+        task = Task.__new__(Task)
+        task.subtasks = []
+        self._apply_dict(task, data)
+        return task
+        
+    def _apply_dict(self, task: Task, data: dict):
         task.id = data['id']
-        task.status = TaskStatus(data['status'])
+        # Share one string object per distinct title and description
+        task.title = self._strings.setdefault(data['title'], data['title'])
+        task.description = self._strings.setdefault(data['description'], data['description'])
+        task.parent_id = data.get('parent_id')
+        task.project_id = data.get('project_id')
+        if data.get('task_type'):
+            task.task_type = _TASK_TYPES[data['task_type']]
+        else:
+            task.task_type = TaskType.MAIN if task.parent_id is None else TaskType.SUBTASK
+        task.status = _STATUSES[data['status']]
         task.created_at = datetime.fromisoformat(data['created_at'])
         task.started_at = datetime.fromisoformat(data['started_at']) if data.get('started_at') else None
         task.completed_at = datetime.fromisoformat(data['completed_at']) if data.get('completed_at') else None
         task.estimated_duration = data['estimated_duration']
         task.actual_duration = data['actual_duration']
-        task.time_blocks = data.get('time_blocks', [])
+        task.time_blocks = list(data.get('time_blocks', []))
         task.is_resumed = data.get('is_resumed', False)
-        return task
         
-    def _rebuild_task_relationships(self):
+    def _rebuild_task_relationships(self, positions: Optional[Dict[str, Optional[int]]] = None):
+        """Attach loaded tasks to their parents, ordered by their saved ``position``.
+        
+        Records without a position, as in snapshots that predate it, keep file order.
+        """
+        # Track attached children in a set so the rebuild stays linear
+        attached = {id(subtask) for task in self.tasks.values() for subtask in task.subtasks}
+        reordered = {}
         for task in self.tasks.values():
             if task.parent_id:
                 parent = self.tasks.get(task.parent_id)
-                if parent and task not in parent.subtasks:
-                    parent.subtasks.append(task)
\ No newline at end of file
+                if parent and id(task) not in attached:
+                    parent.subtasks.append(task)
+                    attached.add(id(task))
+                    reordered[id(parent)] = parent
+        if positions:
+            def saved_position(subtask: Task) -> int:
+                position = positions.get(subtask.id)
+                # Unpositioned children go last; the sort is stable, so they keep file order
+                return len(self.tasks) if position is None else position
+                
+            for parent in reordered.values():
+                parent.subtasks.sort(key=saved_position)
\ No newline at end of file
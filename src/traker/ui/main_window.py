@@ -2,20 +2,56 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, GLib, Gio
 
+from typing import Optional
+
 from ..task import TaskStatus, TaskType
 from ..task_manager import TaskManager
 from .timer_widget import TimerWidget
 
+# Rows built synchronously on refresh; the rest are added at idle priority
+ROWS_PER_CHUNK = 20
+
 class MainWindow(Gtk.ApplicationWindow):
-    def __init__(self, app, task_manager: TaskManager):
+    def __init__(self, app, task_manager: Optional[TaskManager] = None):
         super().__init__(application=app)
         self.task_manager = task_manager
+        self.populate_source_id = None
         self.set_title("Traker - Task Manager")
         self.set_default_size(800, 600)
         
         self.setup_ui()
+        self.setup_actions()
+        if self.task_manager is not None:
+            self.task_manager.add_change_listener(self.update_history_actions)
+        self.refresh_task_list()
+        
+    def set_task_manager(self, task_manager: TaskManager):
+        self.task_manager = task_manager
+        self.timer_widget.task_manager = task_manager
+        self.task_manager.add_change_listener(self.update_history_actions)
+        self.add_task_btn.set_sensitive(True)
+        self.update_history_actions()
         self.refresh_task_list()
         
+    def setup_actions(self):
+        self.undo_action = Gio.SimpleAction.new("undo", None)
+        self.undo_action.connect("activate", lambda action, param: self.on_undo())
+        self.add_action(self.undo_action)
+        
+        self.redo_action = Gio.SimpleAction.new("redo", None)
+        self.redo_action.connect("activate", lambda action, param: self.on_redo())
+        self.add_action(self.redo_action)
+        
+        app = self.get_application()
+        app.set_accels_for_action("win.undo", ["<Control>z"])
+        app.set_accels_for_action("win.redo", ["<Control><Shift>z", "<Control>y"])
+        self.update_history_actions()
+        
+    def update_history_actions(self):
+        history = self.task_manager.history if self.task_manager else None
+        self.undo_action.set_enabled(bool(history and history.can_undo()))
+        self.redo_action.set_enabled(bool(history and history.can_redo()))
+        
     def setup_ui(self):
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         main_box.set_margin_start(10)
@@ -28,16 +64,25 @@ class MainWindow(Gtk.ApplicationWindow):
         header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
         header_box.add_css_class("background-alt")
         
-        add_task_btn = Gtk.Button(label="Add Task")
-        add_task_btn.add_css_class("start-button")
-        add_task_btn.connect("clicked", self.on_add_task_clicked)
-        header_box.append(add_task_btn)
+        self.add_task_btn = Gtk.Button(label="Add Task")
+        self.add_task_btn.add_css_class("start-button")
+        self.add_task_btn.connect("clicked", self.on_add_task_clicked)
+        self.add_task_btn.set_sensitive(self.task_manager is not None)
+        header_box.append(self.add_task_btn)
         
         refresh_btn = Gtk.Button(label="Refresh")
         refresh_btn.add_css_class("start-button")
         refresh_btn.connect("clicked", lambda x: self.refresh_task_list())
         header_box.append(refresh_btn)
         
+        undo_btn = Gtk.Button(label="Undo")
+        undo_btn.set_action_name("win.undo")
+        header_box.append(undo_btn)
+        
+        redo_btn = Gtk.Button(label="Redo")
+        redo_btn.set_action_name("win.redo")
+        header_box.append(redo_btn)
+        
         main_box.append(header_box)
         
         # Timer widget
@@ -60,6 +105,10 @@ class MainWindow(Gtk.ApplicationWindow):
         self.set_child(main_box)
         
     def refresh_task_list(self):
+        if self.populate_source_id is not None:
+            GLib.source_remove(self.populate_source_id)
+            self.populate_source_id = None
+            
         # Clear existing items
         while True:
             row = self.task_list_box.get_first_child()
@@ -67,9 +116,36 @@ class MainWindow(Gtk.ApplicationWindow):
                 break
             self.task_list_box.remove(row)
             
-        # Add all main tasks
-        for task in self.task_manager.get_all_tasks():
+        if self.task_manager is None:
+            loading_label = Gtk.Label(label="Loading tasks...")
+            loading_label.add_css_class("status")
+            self.task_list_box.append(loading_label)
+            return
+            
+        # Add all main tasks, first chunk now and the rest when idle
+        tasks = iter(self.task_manager.get_all_tasks())
+        if self.populate_task_chunk(tasks):
+            self.populate_source_id = GLib.idle_add(
+                self.populate_task_chunk, tasks, priority=GLib.PRIORITY_LOW
+            )
+            
+    def show_load_error(self, error: Exception):
+        row = self.task_list_box.get_first_child()
+        if row is not None:
+            self.task_list_box.remove(row)
+        error_label = Gtk.Label(label=f"Could not load tasks: {error}")
+        error_label.set_wrap(True)
+        error_label.add_css_class("status")
+        self.task_list_box.append(error_label)
+        
+    def populate_task_chunk(self, tasks) -> bool:
+        for _ in range(ROWS_PER_CHUNK):
+            task = next(tasks, None)
+            if task is None:
+                self.populate_source_id = None
+                return False
             self.add_task_row(task)
+        return True
             
     def add_task_row(self, task):
         row = Gtk.ListBoxRow()
@@ -160,9 +236,12 @@ class MainWindow(Gtk.ApplicationWindow):
             subtask_label.add_css_class("title")
             task_box.append(subtask_label)
             
-            for subtask in task.subtasks:
+            # Every level below the root, indented by depth
+            for subtask, depth in task.walk():
+                if subtask is task:
+                    continue
                 subtask_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-                subtask_box.set_margin_start(20)
+                subtask_box.set_margin_start(20 * depth)
                 subtask_box.add_css_class("subtask-container")
                 if subtask.task_type == TaskType.CONTEXT:
                     subtask_box.add_css_class("context-task")
@@ -232,6 +311,26 @@ class MainWindow(Gtk.ApplicationWindow):
         if self.task_manager.current_task == task:
             self.timer_widget.clear_current_task()
         self.refresh_task_list()
+        
+    def on_undo(self):
+        if self.task_manager and self.task_manager.undo():
+            self.sync_timer_task()
+            self.refresh_task_list()
+            
+    def on_redo(self):
+        if self.task_manager and self.task_manager.redo():
+            self.sync_timer_task()
+            self.refresh_task_list()
+            
+    def sync_timer_task(self):
+        # Undo/redo may replace or remove the task shown in the timer
+        shown = self.timer_widget.current_task
+        if shown is not None:
+            task = self.task_manager.get_task(shown.id)
+            if task is None:
+                self.timer_widget.clear_current_task()
+            else:
+                self.timer_widget.set_current_task(task)
 
 class TaskCreationDialog(Gtk.Window):
     def __init__(self, parent):
@@ -1,6 +1,6 @@
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk, GLib
+from gi.repository import Gtk, GLib, Pango
 
 from ..task import Task, TaskStatus
 from ..task_manager import TaskManager
@@ -12,11 +12,20 @@ class TimerWidget(Gtk.Box):
         self.current_task = None
         self.timer_id = None
         self.time_remaining = 0  # in seconds
+        self.deadline = None  # monotonic microseconds while running
         self.is_break_time = False
         self.is_running = False
+        self.session_task_id = None  # task the running timer was started for
+        self.display_mode = "work-time"
+        self.shown_time = "00:00"
         
         self.setup_ui()
         
+        # Tick once per minute instead of once per second while not visible
+        self.connect("map", self.on_visibility_changed)
+        self.connect("unmap", self.on_visibility_changed)
+        self.connect("realize", self.on_realize)
+        
     def setup_ui(self):
         # Current task info
         self.task_info_frame = Gtk.Frame()
@@ -51,8 +60,12 @@ class TimerWidget(Gtk.Box):
         timer_box.set_margin_bottom(10)
         timer_box.add_css_class("background-alt")
         
-        self.time_display = Gtk.Label(label="00:00")
-        self.time_display.set_markup("<span size='xx-large'><b>00:00</b></span>")
+        # Styled with attributes once, so ticks only need set_text
+        attributes = Pango.AttrList()
+        attributes.insert(Pango.attr_scale_new(Pango.SCALE_XX_LARGE))
+        attributes.insert(Pango.attr_weight_new(Pango.Weight.BOLD))
+        self.time_display = Gtk.Label(label=self.shown_time)
+        self.time_display.set_attributes(attributes)
         self.time_display.set_halign(Gtk.Align.CENTER)
         self.time_display.add_css_class("timer-display")
         self.time_display.add_css_class("work-time")
@@ -150,6 +163,7 @@ class TimerWidget(Gtk.Box):
         if not self.current_task:
             return
             
+        self.stop_session()
         self.time_remaining = minutes * 60
         self.is_break_time = False
         self.is_running = True
@@ -158,11 +172,14 @@ class TimerWidget(Gtk.Box):
         self.update_timer_controls()
         
         # Start the countdown
-        self.timer_id = GLib.timeout_add(1000, self.on_timer_tick)
+        self.start_countdown()
+        self.session_task_id = self.current_task.id
+        self.record_session_event("start")
         
         self.timer_status_label.set_text(f"Working - {minutes} minutes")
         
     def start_break_timer(self):
+        self.stop_session()
         self.time_remaining = 10 * 60  # 10 minutes
         self.is_break_time = True
         self.is_running = True
@@ -171,7 +188,9 @@ class TimerWidget(Gtk.Box):
         self.update_timer_controls()
         
         # Start the countdown
-        self.timer_id = GLib.timeout_add(1000, self.on_timer_tick)
+        self.start_countdown()
+        self.session_task_id = self.current_task.id if self.current_task else None
+        self.record_session_event("start")
         
         self.timer_status_label.set_text("Break time - 10 minutes")
         
@@ -179,19 +198,76 @@ class TimerWidget(Gtk.Box):
         duration = int(self.duration_spin.get_value())
         self.start_timer(duration)
         
+    def start_countdown(self):
+        self.deadline = GLib.get_monotonic_time() + self.time_remaining * 1000000
+        self.schedule_tick()
+        
+    def schedule_tick(self):
+        if self.timer_id:
+            GLib.source_remove(self.timer_id)
+        remaining_us = max(self.deadline - GLib.get_monotonic_time(), 0)
+        if self.is_displayed():
+            # Wake just after the shown second changes
+            delay_ms = (remaining_us % 1000000) // 1000 or 1000
+            self.timer_id = GLib.timeout_add(delay_ms + 1, self.on_timer_tick)
+        else:
+            # Coarse, coalesced wakeups: once a minute or at the deadline
+            delay_s = min(60, -(-remaining_us // 1000000))
+            self.timer_id = GLib.timeout_add_seconds(max(delay_s, 1), self.on_timer_tick)
+            
+    def sync_time_remaining(self):
+        if self.deadline is not None:
+            remaining_us = self.deadline - GLib.get_monotonic_time()
+            self.time_remaining = max(-(-remaining_us // 1000000), 0)
+            
+    def is_displayed(self) -> bool:
+        if not self.get_mapped():
+            return False
+        root = self.get_root()
+        if root is not None and root.find_property("suspended") is not None:
+            return not root.get_property("suspended")
+        return True
+        
+    def on_realize(self, widget):
+        root = self.get_root()
+        # GtkWindow:suspended (GTK 4.12) covers minimized and fully hidden windows
+        if root is not None and root.find_property("suspended") is not None:
+            root.connect("notify::suspended", self.on_visibility_changed)
+            
+    def on_visibility_changed(self, *args):
+        if self.timer_id:
+            self.sync_time_remaining()
+            if self.is_displayed():
+                self.update_timer_display()
+            self.schedule_tick()
+            
     def on_timer_tick(self):
+        self.timer_id = None
+        self.sync_time_remaining()
         if self.time_remaining > 0:
-            self.time_remaining -= 1
-            self.update_timer_display()
-            return True  # Continue the timer
+            if self.is_displayed():
+                self.update_timer_display()
+            self.schedule_tick()
         else:
             # Timer finished
             self.on_timer_finished()
-            return False  # Stop the timer
+        return False  # Each tick schedules the next one
+            
+    def record_session_event(self, kind: str):
+        if self.task_manager is not None:
+            self.task_manager.sessions.record(kind, self.session_task_id, self.is_break_time)
+            
+    def stop_session(self):
+        # A running or paused countdown that is replaced or dropped still needs closing
+        if self.time_remaining > 0:
+            self.record_session_event("stop")
             
     def on_timer_finished(self):
         self.is_running = False
         self.timer_id = None
+        self.deadline = None
+        self.record_session_event("finish")
+        self.update_timer_display()
         
         if self.is_break_time:
             self.timer_status_label.set_text("Break finished!")
@@ -223,15 +299,27 @@ class TimerWidget(Gtk.Box):
         if self.timer_id:
             GLib.source_remove(self.timer_id)
             self.timer_id = None
+            self.sync_time_remaining()
+            self.deadline = None
             self.is_running = False
+            self.update_timer_display()
+            self.record_session_event("pause")
             self.timer_status_label.set_text("Timer paused")
             self.update_timer_controls()
+        elif self.time_remaining > 0:
+            self.is_running = True
+            self.start_countdown()
+            self.record_session_event("resume")
+            self.timer_status_label.set_text("Break time" if self.is_break_time else "Working")
+            self.update_timer_controls()
             
     def on_stop_clicked(self, button):
         if self.timer_id:
             GLib.source_remove(self.timer_id)
             self.timer_id = None
             
+        self.stop_session()
+        self.deadline = None
         self.is_running = False
         self.time_remaining = 0
         self.update_timer_display()
@@ -243,20 +331,22 @@ class TimerWidget(Gtk.Box):
         seconds = self.time_remaining % 60
         time_str = f"{minutes:02d}:{seconds:02d}"
         
-        # Update CSS classes for proper theming
-        self.time_display.remove_css_class("break-time")
-        self.time_display.remove_css_class("work-time")
-        
-        if self.is_break_time:
-            self.time_display.add_css_class("break-time")
-        else:
-            self.time_display.add_css_class("work-time")
+        # Only restyle on work/break transitions
+        mode = "break-time" if self.is_break_time else "work-time"
+        if mode != self.display_mode:
+            self.time_display.remove_css_class(self.display_mode)
+            self.time_display.add_css_class(mode)
+            self.display_mode = mode
             
-        self.time_display.set_markup(f"<span size='xx-large'><b>{time_str}</b></span>")
+        if time_str != self.shown_time:
+            self.time_display.set_text(time_str)
+            self.shown_time = time_str
             
     def update_timer_controls(self):
         self.start_25_btn.set_sensitive(not self.is_running and self.current_task is not None)
         self.start_50_btn.set_sensitive(not self.is_running and self.current_task is not None)
         self.start_break_btn.set_sensitive(not self.is_running)
-        self.pause_btn.set_sensitive(self.is_running)
+        # Pause doubles as Resume while a paused countdown has time left
+        self.pause_btn.set_sensitive(self.is_running or self.time_remaining > 0)
+        self.pause_btn.set_label("Pause" if self.is_running or self.time_remaining == 0 else "Resume")
         self.stop_btn.set_sensitive(self.is_running or self.time_remaining > 0)
\ No newline at end of file
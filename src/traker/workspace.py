@@ -0,0 +1,173 @@
+"""
+Workspaces and projects, mirroring electron-tracker/src/shared/Workspace.js and Project.js.
+
+Each workspace keeps its tasks in its own snapshot file (a shard), so only
+the active workspace is loaded and saved. The registry file next to the task
+snapshot holds only the workspace and project metadata.
+"""
+
+from typing import Dict, List, Optional
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+import json
+import uuid
+
+class ProjectStatus(Enum):
+    ACTIVE = "active"
+    ON_HOLD = "on_hold"
+    COMPLETED = "completed"
+    ARCHIVED = "archived"
+
+class Workspace:
+    def __init__(self, name: str, color: str = "#81a1c1"):
+        self.id = str(uuid.uuid4())
+        self.name = name
+        self.color = color
+        self.created_at = datetime.now()
+        self.is_default = False
+        
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'color': self.color,
+            'created_at': self.created_at.isoformat(),
+            'is_default': self.is_default
+        }
+        
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Workspace':
+        workspace = cls(data['name'], data.get('color', "#81a1c1"))
+        workspace.id = data['id']
+        workspace.created_at = datetime.fromisoformat(data['created_at'])
+        workspace.is_default = data.get('is_default', False)
+        return workspace
+        
+    def __repr__(self):
+        return f"Workspace('{self.name}')"
+
+class Project:
+    def __init__(self, name: str, description: str = "", workspace_id: Optional[str] = None):
+        self.id = str(uuid.uuid4())
+        self.name = name
+        self.description = description
+        self.workspace_id = workspace_id
+        self.status = ProjectStatus.ACTIVE
+        self.created_at = datetime.now()
+        self.updated_at = datetime.now()
+        self.color = "#81a1c1"
+        self.priority = "medium"  # low, medium, high
+        self.deadline: Optional[datetime] = None
+        self.progress = 0  # 0-100 percentage
+        
+    def update_progress(self, completed_tasks: int, total_tasks: int):
+        self.progress = round(completed_tasks / total_tasks * 100) if total_tasks else 0
+        self.updated_at = datetime.now()
+        
+    def is_overdue(self) -> bool:
+        if not self.deadline:
+            return False
+        return datetime.now() > self.deadline and self.status != ProjectStatus.COMPLETED
+        
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'workspace_id': self.workspace_id,
+            'status': self.status.value,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+            'color': self.color,
+            'priority': self.priority,
+            'deadline': self.deadline.isoformat() if self.deadline else None,
+            'progress': self.progress
+        }
+        
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Project':
+        project = cls(data['name'], data.get('description', ""), data.get('workspace_id'))
+        project.id = data['id']
+        project.status = ProjectStatus(data['status'])
+        project.created_at = datetime.fromisoformat(data['created_at'])
+        project.updated_at = datetime.fromisoformat(data['updated_at'])
+        project.color = data.get('color', "#81a1c1")
+        project.priority = data.get('priority', "medium")
+        project.deadline = datetime.fromisoformat(data['deadline']) if data.get('deadline') else None
+        project.progress = data.get('progress', 0)
+        return project
+        
+    def __repr__(self):
+        return f"Project('{self.name}', status={self.status.value}, progress={self.progress}%)"
+
+class WorkspaceRegistry:
+    """Workspace and project metadata for the task snapshot at ``data_file``.
+    
+    The default workspace keeps its tasks in ``data_file`` itself, so snapshots
+    from before workspaces existed open as that workspace. Other workspaces
+    are sharded into ``<data_file stem>_workspaces/<workspace id>.json``.
+    A registry that is not ``persistent`` never reads or writes its file.
+    """
+        
+    def __init__(self, data_file: str, persistent: bool = True):
+        base = str(Path(data_file).with_suffix(''))
+        self.data_file = data_file
+        self.persistent = persistent
+        self.path = base + "_workspaces.json"
+        self.shard_directory = Path(base + "_workspaces")
+        self.workspaces: Dict[str, Workspace] = {}
+        self.projects: Dict[str, Project] = {}
+        self.current_workspace_id: Optional[str] = None
+        self.current_project_id: Optional[str] = None
+        self.load()
+        if not self.workspaces:
+            # Like the Electron app; written out on the first change
+            self.create_default_workspaces()
+        if self.current_workspace_id not in self.workspaces:
+            self.current_workspace_id = next(iter(self.workspaces))
+        
+    def create_default_workspaces(self):
+        work = Workspace("Work", "#81a1c1")
+        work.is_default = True
+        personal = Workspace("Personal", "#a3be8c")
+        self.workspaces[work.id] = work
+        self.workspaces[personal.id] = personal
+        self.current_workspace_id = work.id
+        
+    def shard_path(self, workspace_id: str) -> str:
+        if self.workspaces[workspace_id].is_default:
+            return self.data_file
+        return str(self.shard_directory / f"{workspace_id}.json")
+        
+    def get_projects(self, workspace_id: str) -> List[Project]:
+        return [project for project in self.projects.values() if project.workspace_id == workspace_id]
+        
+    def load(self):
+        try:
+            if self.persistent and Path(self.path).exists():
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                self.workspaces = {workspace_id: Workspace.from_dict(workspace_data)
+                                   for workspace_id, workspace_data in data.get('workspaces', {}).items()}
+                self.projects = {project_id: Project.from_dict(project_data)
+                                 for project_id, project_data in data.get('projects', {}).items()}
+                self.current_workspace_id = data.get('current_workspace_id')
+                self.current_project_id = data.get('current_project_id')
+        except Exception as e:
+            print(f"Error loading workspaces: {e}")
+        
+    def save(self):
+        if not self.persistent:
+            return
+        data = {
+            'workspaces': {workspace_id: workspace.to_dict() for workspace_id, workspace in self.workspaces.items()},
+            'projects': {project_id: project.to_dict() for project_id, project in self.projects.items()},
+            'current_workspace_id': self.current_workspace_id,
+            'current_project_id': self.current_project_id
+        }
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            print(f"Error saving workspaces: {e}")
\ No newline at end of file
@@ -0,0 +1,89 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from traker import archive
+from traker.archive import ArchivePolicy, TaskArchive
+from traker.task_manager import TaskManager
+
+NOW = datetime(2024, 6, 30)
+POLICY = ArchivePolicy(completed_days=30)
+
+def finished_tree(manager, title, completed_at):
+    root = manager.create_task(title)
+    for task in root.iter_subtree():
+        task.complete()
+        task.completed_at = completed_at
+    return root
+
+@pytest.fixture
+def manager(tmp_path):
+    return TaskManager(str(tmp_path / "tasks.json"))
+
+def test_archived_trees_round_trip(manager):
+    root = finished_tree(manager, "Done", datetime(2024, 4, 10))
+    manager.create_task("Open")
+
+    assert manager.archive_completed(POLICY, NOW) == 1
+    assert [task.title for task in manager.get_all_tasks()] == ["Open"]
+    assert [task.id for task in manager.iter_archived_tasks()] == [root.id, root.subtasks[0].id]
+    assert [task.title for task in manager.search_archive("subdivide")] == ["Subdivide: Done"]
+
+def test_since_and_until_filter_whole_trees_by_root(manager):
+    april = finished_tree(manager, "April", datetime(2024, 4, 30))
+    # A subtask finished in March stays with its root's April tree
+    april.subtasks[0].completed_at = datetime(2024, 3, 31)
+    finished_tree(manager, "May", datetime(2024, 5, 2))
+    manager.archive_completed(POLICY, NOW)
+
+    since = [task.title for task in manager.iter_archived_tasks(since=datetime(2024, 4, 1))]
+    assert since == ["April", "Subdivide: April", "May", "Subdivide: May"]
+    until = [task.title for task in manager.iter_archived_tasks(until=datetime(2024, 4, 30))]
+    assert until == ["April", "Subdivide: April"]
+
+def test_failed_staging_leaves_archive_and_tasks_unchanged(manager, monkeypatch):
+    finished_tree(manager, "April", datetime(2024, 4, 10))
+    finished_tree(manager, "May", datetime(2024, 5, 10))
+    real_open = archive.gzip.open
+    calls = []
+
+    def failing_open(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(archive.gzip, "open", failing_open)
+    assert manager.archive_completed(POLICY, NOW) == 0
+    assert len(manager.get_all_tasks()) == 2
+    assert manager.archive.partitions() == []
+    assert list(manager.archive.directory.iterdir()) == []
+
+def test_partial_write_drops_only_archived_trees(manager, monkeypatch):
+    finished_tree(manager, "April", datetime(2024, 4, 10))
+    finished_tree(manager, "May", datetime(2024, 5, 10))
+    real_replace = os.replace
+    calls = []
+
+    def failing_replace(src, dst):
+        calls.append(dst)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(archive.os, "replace", failing_replace)
+    assert manager.archive_completed(POLICY, NOW) == 1
+    assert [task.title for task in manager.get_all_tasks()] == ["May"]
+
+    monkeypatch.setattr(archive.os, "replace", real_replace)
+    assert manager.archive_completed(POLICY, NOW) == 1
+    titles = [task.title for task in manager.iter_archived_tasks() if task.parent_id is None]
+    assert titles == ["April", "May"]
+
+def test_appends_add_to_existing_partitions(tmp_path):
+    store = TaskArchive(str(tmp_path / "archive"))
+    record = {'id': 'a', 'parent_id': None, 'completed_at': '2024-04-01T00:00:00', 'title': 'A', 'description': ''}
+    store.append([[record]])
+    store.append([[dict(record, id='b')]])
+    assert [r['id'] for r in store.iter_records()] == ['a', 'b']
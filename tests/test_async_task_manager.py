@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from traker import async_task_manager
+from traker.async_task_manager import AsyncTaskManager
+from traker.storage import MemoryStorage
+
+class FlakyStorage(MemoryStorage):
+    """Fails the first ``failures`` saves."""
+
+    def __init__(self, failures: int = 0):
+        super().__init__()
+        self.failures = failures
+        self.saves = 0
+
+    def save(self, changed, deleted):
+        self.saves += 1
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disk full")
+        super().save(changed, deleted)
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(async_task_manager, "RETRY_DELAYS", (0, 0, 0))
+
+def test_mutations_coalesce_into_one_write():
+    async def run():
+        storage = FlakyStorage()
+        manager = await AsyncTaskManager.open(storage=storage)
+        for i in range(5):
+            await manager.create_task(f"Task {i}")
+        await manager.flush()
+        return storage
+
+    storage = asyncio.run(run())
+    assert storage.saves == 1
+    assert len(storage.records) == 10
+
+def test_failed_writes_are_retried():
+    async def run():
+        storage = FlakyStorage(failures=2)
+        manager = await AsyncTaskManager.open(storage=storage)
+        await manager.create_task("Task")
+        await manager.flush()
+        return storage
+
+    storage = asyncio.run(run())
+    assert storage.saves == 3
+    assert len(storage.records) == 2
+
+def test_flush_raises_while_changes_are_unsaved():
+    async def run():
+        storage = FlakyStorage(failures=100)
+        manager = await AsyncTaskManager.open(storage=storage)
+        await manager.create_task("Task")
+        with pytest.raises(OSError):
+            await manager.flush()
+        assert storage.records == {}
+
+        storage.failures = 0
+        await manager.flush()
+        return storage
+
+    storage = asyncio.run(run())
+    assert len(storage.records) == 2
+
+def test_writer_refuses_to_replace_an_unreadable_file(tmp_path):
+    data_file = tmp_path / "tasks.json"
+    data_file.write_text("{ not json")
+
+    async def run():
+        manager = await AsyncTaskManager.open(str(data_file))
+        await manager.create_task("Task")
+        with pytest.raises(ValueError):
+            await manager.flush()
+
+    asyncio.run(run())
+    assert data_file.read_text() == "{ not json"
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from traker import exchange
+from traker.storage import MemoryStorage
+from traker.task_manager import TaskManager
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_object_reader_across_chunk_boundaries(tmp_path, monkeypatch, chunk_size):
+    data = {
+        "a": {"title": "Braces } and { quotes \" inside", "n": [1, 2.5, None, True]},
+        "b": "unicode é中 and escapes \\n",
+        "c": 1234567890,
+        "d": {},
+    }
+    path = tmp_path / "object.json"
+    path.write_text(json.dumps(data, indent=1), encoding="utf-8")
+    monkeypatch.setattr(exchange, "_CHUNK_SIZE", chunk_size)
+
+    assert dict(exchange.iter_json_object(str(path))) == data
+
+def test_jsonl_round_trip(tmp_path):
+    source = TaskManager(storage=MemoryStorage())
+    root = source.create_task("Root", "Description")
+    source.add_subtask(root.id, "Child")
+    source.move_task(source.get_task(root.id).subtasks[1].id, root.id, 0)
+    path = str(tmp_path / "tasks.jsonl")
+    exchange.export_tasks(source, path, "jsonl")
+
+    target = TaskManager(storage=MemoryStorage())
+    assert exchange.import_tasks(target, path, "jsonl") == 3
+    assert [task.title for task in target.get_task(root.id).subtasks] == ["Child", "Subdivide: Root"]
+
+def test_csv_import_is_refused(tmp_path):
+    with pytest.raises(ValueError):
+        exchange.read_records(str(tmp_path / "blocks.csv"), "csv")
+
+def test_import_is_one_undo_step(tmp_path):
+    source = TaskManager(storage=MemoryStorage())
+    source.create_task("Root")
+    path = str(tmp_path / "tasks.jsonl")
+    exchange.export_tasks(source, path, "jsonl")
+
+    target = TaskManager(storage=MemoryStorage())
+    exchange.import_tasks(target, path, "jsonl")
+    assert target.undo()
+    assert target.tasks == {}
+
+def test_electron_round_trip_adopts_projects(tmp_path):
+    source = TaskManager(storage=MemoryStorage())
+    project = source.create_project("Client")
+    root = source.create_task("Root", project_id=project.id)
+    source.add_subtask(root.id, "Child")
+    path = str(tmp_path / "tasks.json")
+    exchange.export_tasks(source, path, "electron")
+
+    exported = json.loads((tmp_path / "tasks.json").read_text())
+    assert {task["workspaceId"] for task in exported.values()} == {source.workspaces.current_workspace_id}
+    assert (tmp_path / "tasks_workspaces.json").exists()
+
+    target = TaskManager(storage=MemoryStorage())
+    assert exchange.import_tasks(target, path, "electron") == 3
+    assert target.get_project(project.id).name == "Client"
+    assert [task.title for task in target.get_task(root.id).subtasks] == ["Subdivide: Root", "Child"]
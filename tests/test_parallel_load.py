@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from traker import parallel_load
+from traker.parallel_load import load_tasks_parallel
+from traker.storage import JsonFileStorage, MemoryStorage
+from traker.task_manager import TaskManager
+
+@pytest.fixture
+def snapshot(tmp_path):
+    manager = TaskManager(storage=MemoryStorage())
+    with manager.batch():
+        for i in range(6):
+            # Uneven record sizes put chunk boundaries at different points in lines
+            task = manager.create_task(f"Task {i}", "x" * (i * 37))
+            manager.add_subtask(task.id, "Shared subtask title")
+        manager.move_task(task.subtasks[1].id, task.id, 0)
+    path = str(tmp_path / "tasks.json")
+    JsonFileStorage(path).save({record['id']: record for record in manager.iter_records()}, [])
+    return path
+
+def flatten(chunks):
+    return [record for chunk in chunks for record in chunk]
+
+@pytest.mark.parametrize("workers", [2, 3])
+@pytest.mark.parametrize("chunks_per_worker", [1, 4, 10 ** 6])
+def test_chunks_decode_every_record_once_in_file_order(snapshot, monkeypatch, workers, chunks_per_worker):
+    # A million chunks per worker cuts the file into one-byte ranges
+    monkeypatch.setattr(parallel_load, "CHUNKS_PER_WORKER", chunks_per_worker)
+    expected = list(JsonFileStorage(snapshot).load().values())
+
+    assert flatten(load_tasks_parallel(snapshot, workers)) == expected
+
+def test_parallel_load_matches_serial_load(snapshot):
+    serial = TaskManager(storage=JsonFileStorage(snapshot))
+    parallel = TaskManager(storage=JsonFileStorage(snapshot), load_workers=2)
+
+    assert parallel.storage.records == serial.storage.records
+    for task_id, task in serial.tasks.items():
+        assert [subtask.id for subtask in parallel.get_task(task_id).subtasks] == \
+               [subtask.id for subtask in task.subtasks]
+
+def test_files_not_written_one_record_per_line_fall_back(snapshot, tmp_path):
+    records = JsonFileStorage(snapshot).load()
+    compact = tmp_path / "compact.json"
+    compact.write_text(json.dumps(records))
+
+    assert load_tasks_parallel(str(compact), 2) is None
+    manager = TaskManager(storage=JsonFileStorage(str(compact)), load_workers=2)
+    assert set(manager.tasks) == set(records)
+    assert manager.storage.records == records
+
+def test_missing_file_falls_back(tmp_path):
+    assert load_tasks_parallel(str(tmp_path / "missing.json"), 2) is None
+    assert TaskManager(str(tmp_path / "missing.json"), load_workers=2).tasks == {}
@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+
+from traker.scheduler import DayPlanner
+from traker.task import Task
+
+START = datetime(2024, 5, 1, 9, 0)
+
+def make_task(title, minutes):
+    task = Task(title)
+    task.estimated_duration = minutes
+    return task
+
+def test_break_follows_fifty_minutes_of_work():
+    planner = DayPlanner(START, START + timedelta(hours=4))
+    blocks = planner.plan([make_task("A", 30), make_task("B", 40)])
+
+    assert [(b.title if not b.is_break else "Break", b.minutes) for b in blocks] == [
+        ("A", 30), ("B", 20), ("Break", 10), ("B", 20),
+    ]
+
+def test_replanning_only_relays_later_blocks():
+    first, second, third = make_task("A", 30), make_task("B", 30), make_task("C", 30)
+    planner = DayPlanner(START, START + timedelta(hours=4))
+    planner.plan([first, second, third])
+    kept = planner.blocks[0]
+
+    blocks = planner.complete(second.id)
+    assert blocks[0] is kept
+    assert [b.title for b in blocks if not b.is_break] == ["A", "C", "C"]
+    assert second.id not in {b.task_id for b in blocks}
+
+def test_overrun_pushes_work_out_of_the_window():
+    first, second = make_task("A", 20), make_task("B", 20)
+    planner = DayPlanner(START, START + timedelta(hours=1))
+    planner.plan([first, second])
+    assert planner.unscheduled == []
+
+    planner.overrun(first.id, 30)
+    assert planner.unscheduled == [second.id]
@@ -0,0 +1,109 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from traker import sessions
+from traker.sessions import SessionRecorder, iter_events, reconstruct_timeline, summarize
+
+START = datetime(2024, 5, 1, 9, 0, tzinfo=timezone.utc)
+
+def event(minutes, kind, task_id="a", is_break=False):
+    return START + timedelta(minutes=minutes), kind, task_id, is_break
+
+def test_pause_and_resume_split_intervals():
+    events = [
+        event(0, "session", None),
+        event(0, "start"),
+        event(20, "pause"),
+        event(30, "resume"),
+        event(45, "finish"),
+    ]
+    intervals = list(reconstruct_timeline(events))
+
+    assert [(i.ended_by, i.duration) for i in intervals] == [
+        ("pause", timedelta(minutes=20)),
+        ("finish", timedelta(minutes=15)),
+    ]
+    assert summarize(intervals)["a"]["work"] == timedelta(minutes=35)
+
+def test_new_session_closes_open_timers_as_incomplete():
+    events = [
+        event(0, "session", None),
+        event(0, "start"),
+        event(5, "start", "b", True),
+        event(10, "session", None),
+    ]
+    intervals = list(reconstruct_timeline(events))
+
+    assert {(i.task_id, i.ended_by, i.is_break) for i in intervals} == {
+        ("a", "incomplete", False),
+        ("b", "incomplete", True),
+    }
+
+def test_continued_anchor_keeps_the_session_open(tmp_path):
+    path = tmp_path / "sessions.jsonl"
+    resumed = START + timedelta(hours=2)
+    lines = [
+        {"anchor": START.isoformat()},
+        ["start", "a", 0, False],
+        {"anchor": resumed.isoformat(), "continued": True},
+        ["stop", "a", 60000, False],
+    ]
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+    intervals = list(reconstruct_timeline(iter_events(str(path))))
+    assert len(intervals) == 1
+    assert intervals[0].ended_by == "stop"
+    assert intervals[0].end == resumed + timedelta(minutes=1)
+
+class FakeClocks:
+    def __init__(self, monkeypatch):
+        self.monotonic = 1000.0
+        self.wall = START
+        monkeypatch.setattr(sessions.time, "monotonic", lambda: self.monotonic)
+        monkeypatch.setattr(sessions, "_now", lambda: self.wall)
+
+    def advance(self, seconds, wall_step=0):
+        self.monotonic += seconds
+        self.wall += timedelta(seconds=seconds + wall_step)
+
+def recorded_intervals(path):
+    return list(reconstruct_timeline(iter_events(str(path))))
+
+def test_wall_clock_stepped_back_keeps_durations(tmp_path, monkeypatch):
+    clocks = FakeClocks(monkeypatch)
+    path = tmp_path / "sessions.jsonl"
+    recorder = SessionRecorder(str(path))
+    recorder.record("start", "a")
+    # An hour's step back, as when a clock is corrected or leaves daylight saving time
+    clocks.advance(60, wall_step=-3600)
+    recorder.record("stop", "a")
+    recorder.close()
+
+    intervals = recorded_intervals(path)
+    assert [i.duration for i in intervals] == [timedelta(minutes=1)]
+    assert summarize(intervals)["a"]["work"] == timedelta(minutes=1)
+    assert "continued" not in path.read_text()
+
+def test_suspend_re_anchors_the_run(tmp_path, monkeypatch):
+    clocks = FakeClocks(monkeypatch)
+    path = tmp_path / "sessions.jsonl"
+    recorder = SessionRecorder(str(path))
+    recorder.record("start", "a")
+    # Two hours asleep: wall time moves on while the monotonic clock stands still
+    clocks.advance(60, wall_step=7200)
+    recorder.record("stop", "a")
+    recorder.close()
+
+    intervals = recorded_intervals(path)
+    assert [i.duration for i in intervals] == [timedelta(hours=2, minutes=1)]
+    assert intervals[0].start == START
+
+def test_logs_with_local_anchors_still_load(tmp_path):
+    path = tmp_path / "sessions.jsonl"
+    local = datetime(2024, 5, 1, 9, 0)
+    lines = [{"anchor": local.isoformat()}, ["start", "a", 0, False], ["stop", "a", 1000, False]]
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+    (interval,) = recorded_intervals(path)
+    assert interval.start == local.astimezone(timezone.utc)
+    assert interval.duration == timedelta(seconds=1)
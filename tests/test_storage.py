@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from traker.snapshot import STRING_TABLE_KEY, write_json_object
+from traker.storage import JsonFileStorage, MemoryStorage
+from traker.task_manager import TaskManager
+
+def record(task_id, title, description="Shared description"):
+    return {'id': task_id, 'title': title, 'description': description, 'parent_id': None}
+
+def test_string_table_round_trip(tmp_path):
+    path = str(tmp_path / "tasks.json")
+    records = {str(i): record(str(i), "Same title" if i % 2 else f"Title {i}") for i in range(6)}
+    JsonFileStorage(path).save(records, [])
+
+    data = json.loads((tmp_path / "tasks.json").read_text())
+    assert sorted(data.pop(STRING_TABLE_KEY)) == sorted(
+        ["Same title", "Title 0", "Title 2", "Title 4", "Shared description"])
+    assert all(isinstance(saved['title'], int) for saved in data.values())
+    assert JsonFileStorage(path).load() == records
+
+def test_loads_snapshots_written_before_the_string_table(tmp_path):
+    path = tmp_path / "tasks.json"
+    records = {"a": record("a", "Plain title")}
+    path.write_text(json.dumps(records))
+
+    assert JsonFileStorage(str(path)).load() == records
+
+def test_failed_write_keeps_the_previous_file(tmp_path):
+    directory = tmp_path / "data"
+    directory.mkdir()
+    path = directory / "tasks.json"
+    write_json_object([("a", 1)], str(path))
+
+    def members():
+        yield "a", 2
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        write_json_object(members(), str(path))
+    assert json.loads(path.read_text()) == {"a": 1}
+    assert [p.name for p in directory.iterdir()] == ["tasks.json"]
+
+def test_loaded_tasks_share_repeated_strings(tmp_path):
+    path = str(tmp_path / "tasks.json")
+    JsonFileStorage(path).save({"a": dict(record("a", "Same"), status="pending", created_at="2024-05-01T09:00:00",
+                                          estimated_duration=50, actual_duration=0),
+                                "b": dict(record("b", "Same"), status="pending", created_at="2024-05-01T09:00:00",
+                                          estimated_duration=50, actual_duration=0)}, [])
+    manager = TaskManager(storage=JsonFileStorage(path))
+    assert manager.get_task("a").title is manager.get_task("b").title
+
+def test_shared_strings_of_deleted_tasks_are_dropped():
+    manager = TaskManager(storage=MemoryStorage())
+    with manager.batch():
+        for i in range(500):
+            manager.create_task(f"Task {i}", f"Description {i}")
+    # Redo rebuilds the tasks from records, which shares their strings
+    manager.undo()
+    manager.redo()
+    assert len(manager._strings) >= 1000
+
+    with manager.batch():
+        for task in manager.get_all_tasks():
+            manager.delete_task(task.id)
+    assert len(manager._strings) <= 2 * len(manager.tasks) + 256
+
+class RecordingStorage(MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.saves = []
+
+    def save(self, changed, deleted):
+        self.saves.append((list(changed), list(deleted)))
+        super().save(changed, deleted)
+
+def test_saves_only_pass_changed_and_deleted_tasks_in_order():
+    storage = RecordingStorage()
+    manager = TaskManager(storage=storage)
+    first = manager.create_task("First")
+    second = manager.create_task("Second")
+    storage.saves.clear()
+
+    manager.complete_task(second.id)
+    manager.delete_task(first.id)
+    assert storage.saves == [([second.id], []), ([], [first.id, first.subtasks[0].id])]
+    assert [record['title'] for record in storage.query(lambda record: record['status'] == "completed")] == ["Second"]
+
+def test_memory_storage_reopens_with_its_records():
+    storage = MemoryStorage()
+    manager = TaskManager(storage=storage)
+    with manager.batch():
+        for i in range(3):
+            manager.create_task(f"Task {i}")
+
+    reopened = TaskManager(storage=storage)
+    assert [task.title for task in reopened.get_all_tasks()] == ["Task 0", "Task 1", "Task 2"]
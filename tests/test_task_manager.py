@@ -0,0 +1,194 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from traker.archive import ArchivePolicy
+from traker.storage import MemoryStorage
+from traker.task_manager import TaskManager
+
+def titles(tasks):
+    return [task.title for task in tasks]
+
+def test_batch_rollback_restores_tasks():
+    storage = MemoryStorage()
+    manager = TaskManager(storage=storage)
+    task = manager.create_task("Keep")
+    saved = dict(storage.records)
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.create_task("Discard")
+            manager.delete_task(task.id)
+            raise RuntimeError
+
+    assert titles(manager.get_all_tasks()) == ["Keep"]
+    assert manager.get_task(task.id).subtasks[0].title == "Subdivide: Keep"
+    assert storage.records == saved
+
+def test_nested_batch_rolls_back_when_the_error_is_caught():
+    storage = MemoryStorage()
+    manager = TaskManager(storage=storage)
+    changes = []
+    manager.add_change_listener(lambda: changes.append(len(manager.tasks)))
+
+    with manager.batch():
+        kept = manager.create_task("a")
+        try:
+            with manager.batch():
+                manager.create_task("b")
+                manager.complete_task(kept.id)
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+    assert titles(manager.get_all_tasks()) == ["a"]
+    assert manager.get_task(kept.id).completed_at is None
+    assert changes == [2]
+    assert sorted(record['title'] for record in storage.records.values()) == ["Subdivide: a", "a"]
+
+def test_nested_batches_commit_as_one_change():
+    manager = TaskManager(storage=MemoryStorage())
+    changes = []
+    manager.add_change_listener(lambda: changes.append(True))
+
+    with manager.batch():
+        manager.create_task("a")
+        with manager.batch():
+            manager.create_task("b")
+
+    assert changes == [True]
+
+def test_unreadable_task_file_is_never_overwritten(tmp_path):
+    data_file = tmp_path / "tasks.json"
+    manager = TaskManager(str(data_file))
+    for title in ("a", "b", "c"):
+        manager.create_task(title)
+    data_file.write_text(data_file.read_text() + "garbage")
+    content = data_file.read_bytes()
+
+    reopened = TaskManager(str(data_file))
+    assert reopened.load_error is not None
+    assert reopened.tasks == {}
+    reopened.create_task("d")
+    assert data_file.read_bytes() == content
+
+def test_undo_redo_delete_restores_subtree_in_place():
+    manager = TaskManager(storage=MemoryStorage())
+    root = manager.create_task("Root")
+    middle = manager.add_subtask(root.id, "Middle")
+    manager.add_subtask(middle.id, "Leaf")
+    manager.add_subtask(root.id, "Last")
+
+    manager.delete_task(middle.id)
+    assert titles(root.subtasks) == ["Subdivide: Root", "Last"]
+    assert manager.undo()
+    root = manager.get_task(root.id)
+    assert titles(root.subtasks) == ["Subdivide: Root", "Middle", "Last"]
+    assert titles(root.subtasks[1].subtasks) == ["Leaf"]
+    assert manager.redo()
+    assert middle.id not in manager.tasks
+
+def test_undo_restores_the_current_task():
+    manager = TaskManager(storage=MemoryStorage())
+    first = manager.create_task("First")
+    second = manager.create_task("Second")
+    manager.start_task(first.id)
+    manager.start_task(second.id)
+
+    assert manager.undo()
+    assert manager.current_task is first
+    assert manager.get_task(second.id).started_at is None
+    assert manager.redo()
+    assert manager.current_task.id == second.id
+
+def test_history_is_bounded():
+    manager = TaskManager(storage=MemoryStorage())
+    for i in range(150):
+        manager.create_task(str(i))
+
+    undone = 0
+    while manager.undo():
+        undone += 1
+    assert undone == 100
+    assert len(manager.get_all_tasks()) == 50
+
+def test_reload_keeps_subtask_order(tmp_path):
+    data_file = str(tmp_path / "tasks.json")
+    manager = TaskManager(data_file)
+    with manager.batch():
+        root = manager.create_task("Root")
+        subtasks = [manager.add_subtask(root.id, f"s{i}") for i in range(8)]
+    expected = ["Subdivide: Root"] + [f"s{i}" for i in range(8)]
+    assert titles(TaskManager(data_file).get_task(root.id).subtasks) == expected
+
+    manager.move_task(subtasks[7].id, root.id, 0)
+    manager.delete_task(subtasks[3].id)
+    manager.undo()
+    expected = ["s7", "Subdivide: Root"] + [f"s{i}" for i in range(7)]
+    assert titles(manager.get_task(root.id).subtasks) == expected
+    assert titles(TaskManager(data_file).get_task(root.id).subtasks) == expected
+
+def test_get_root_follows_moves():
+    manager = TaskManager(storage=MemoryStorage())
+    first = manager.create_task("First")
+    second = manager.create_task("Second")
+    leaf = manager.add_subtask(first.id, "Leaf")
+    assert manager.get_root(leaf.id) is first
+
+    manager.move_task(first.id, second.id)
+    assert manager.get_root(leaf.id) is second
+    assert manager.get_depth(leaf.id) == 2
+    assert not manager.move_task(second.id, leaf.id)
+
+def test_switch_workspace_loads_only_the_active_shard(tmp_path):
+    data_file = str(tmp_path / "tasks.json")
+    manager = TaskManager(data_file)
+    manager.create_task("Work task")
+    side = manager.create_workspace("Side")
+
+    assert manager.switch_workspace(side.id)
+    assert manager.tasks == {}
+    manager.create_task("Side task")
+
+    reopened = TaskManager(data_file)
+    assert reopened.get_current_workspace().name == "Side"
+    assert titles(reopened.get_all_tasks()) == ["Side task"]
+    work = next(w for w in reopened.get_all_workspaces() if w.is_default)
+    assert reopened.switch_workspace(work.id)
+    assert titles(reopened.get_all_tasks()) == ["Work task"]
+
+def test_delete_workspace_removes_its_shard(tmp_path):
+    data_file = str(tmp_path / "tasks.json")
+    manager = TaskManager(data_file)
+    side = manager.create_workspace("Side")
+    manager.switch_workspace(side.id)
+    manager.create_task("Side task")
+    shard = Path(manager.workspaces.shard_path(side.id))
+    assert shard.exists()
+
+    assert manager.delete_workspace(side.id)
+    assert not shard.exists()
+    assert manager.get_current_workspace().is_default
+
+def test_injected_storage_never_touches_home(isolated_home):
+    storage = MemoryStorage()
+    manager = TaskManager(storage=storage)
+    root = manager.create_task("Done")
+    for task in root.iter_subtree():
+        task.complete()
+        task.completed_at = datetime(2024, 4, 10)
+    manager.sessions.record("start", root.id)
+    manager.sessions.record("finish", root.id)
+
+    assert manager.archive_completed(ArchivePolicy(30), datetime(2024, 6, 30)) == 1
+    assert [task.title for task in manager.iter_archived_tasks()] == ["Done", "Subdivide: Done"]
+    assert [interval.ended_by for interval in manager.get_activity_timeline()] == ["finish"]
+
+    other = manager.create_workspace("Other")
+    assert manager.switch_workspace(other.id)
+    manager.create_task("Elsewhere")
+    assert manager.storage is storage.shards[other.id]
+    assert manager.archive is not storage.archive()
+    assert manager.delete_workspace(other.id)
+    assert list(isolated_home.iterdir()) == []